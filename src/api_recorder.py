@@ -0,0 +1,230 @@
+"""
+This module records API responses and replays them without the network.
+
+The mode is set by the API_RECORD_MODE variable:
+
+- "off": Requests go to the API (default).
+- "record": Every request/response pair is appended to the log.
+- "replay": Responses are served from the log, the API is not called.
+
+The log is a JSON Lines file set by API_RECORD_FILE. Request headers
+are not written, passwords and tokens in bodies are redacted.
+"""
+
+import json
+import logging as logger
+import os
+import threading
+from collections import deque
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+DEFAULT_RECORD_FILE = os.path.join("tests", "recordings", "api.jsonl")
+
+# Response headers kept in the log, the client reads only these.
+RECORDED_HEADERS = ("Content-Type", "Content-Length")
+
+# Body fields replaced by REDACTED in the log, compared case-insensitively.
+REDACTED_FIELDS = frozenset(("password", "token", "authorization"))
+REDACTED = "REDACTED"
+
+
+class ApiRecorder:
+    """
+    Class that writes and serves the API record log.
+
+    Replay looks a response up by method, endpoint and request body.
+    Requests with a body that was not recorded (e.g. random test data)
+    get the responses recorded for the same method and endpoint
+    in the recorded order.
+    """
+
+    _lock = threading.Lock()
+    _file = None
+    _exact: dict | None = None
+    _by_endpoint: dict | None = None
+
+    mode: str = os.getenv("API_RECORD_MODE", "off")
+    record_file: str = os.getenv("API_RECORD_FILE", DEFAULT_RECORD_FILE)
+
+    @staticmethod
+    def redact(data):
+        """
+        Return a copy of the JSON data with secret fields redacted.
+        """
+
+        if isinstance(data, dict):
+            return {
+                key: (
+                    REDACTED
+                    if key.lower() in REDACTED_FIELDS
+                    else ApiRecorder.redact(value)
+                )
+                for key, value in data.items()
+            }
+        if isinstance(data, list):
+            return [ApiRecorder.redact(value) for value in data]
+        return data
+
+    @classmethod
+    def body_key(cls, payload) -> str:
+        """
+        Normalize the request body for the lookup.
+
+        The body is redacted, so a replayed login matches its record.
+        """
+
+        if payload is None:
+            return ""
+        return json.dumps(
+            cls.redact(payload), sort_keys=True, separators=(",", ":")
+        )
+
+    @classmethod
+    def record(
+        cls,
+        method: str,
+        endpoint: str,
+        payload,
+        response: requests.Response,
+    ):
+        """
+        Append the request and its response to the log.
+
+        A JSON response is written with its tokens redacted,
+        replayed calls accept any token.
+        """
+
+        headers = {
+            header: response.headers[header]
+            for header in RECORDED_HEADERS
+            if header in response.headers
+        }
+        content = response.text
+        try:
+            redacted = json.dumps(cls.redact(json.loads(content)))
+        except ValueError:
+            redacted = content
+        if redacted != content:
+            content = redacted
+            if "Content-Length" in headers:
+                headers["Content-Length"] = str(len(content.encode()))
+
+        entry = {
+            "m": method,
+            "e": endpoint,
+            "b": cls.body_key(payload),
+            "s": response.status_code,
+            "h": headers,
+            "c": content,
+        }
+        line = json.dumps(entry, separators=(",", ":")) + "\n"
+
+        with cls._lock:
+            if cls._file is None:
+                directory = os.path.dirname(cls.record_file)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                # pylint: disable=consider-using-with
+                cls._file = open(cls.record_file, "a", encoding="utf-8")
+            cls._file.write(line)
+            cls._file.flush()
+
+    @classmethod
+    def replay(
+        cls, method: str, endpoint: str, url: str, payload
+    ) -> requests.Response:
+        """
+        Return the recorded response for the request.
+        """
+
+        with cls._lock:
+            if cls._exact is None:
+                cls.__load()
+
+            entry = cls.__take(
+                cls._exact.get((method, endpoint, cls.body_key(payload)))
+            ) or cls.__take(
+                cls._by_endpoint.get((method, endpoint)), reuse_last=True
+            )
+            if entry is None:
+                raise requests.ConnectionError(
+                    f"No recorded response for {method} {endpoint} "
+                    f"in {cls.record_file}"
+                )
+
+        response = requests.Response()
+        response.status_code = entry["s"]
+        response.headers = CaseInsensitiveDict(entry["h"])
+        response.url = url
+        response.encoding = "utf-8"
+        # pylint: disable-next=protected-access
+        response._content = entry["c"].encode()
+        return response
+
+    @classmethod
+    def close(cls):
+        """
+        Close the log and drop the replay index.
+        """
+
+        with cls._lock:
+            if cls._file is not None:
+                cls._file.close()
+                cls._file = None
+            cls._exact = None
+            cls._by_endpoint = None
+
+    @classmethod
+    def __load(cls):
+        """
+        Read the log and index it by request.
+        """
+
+        cls._exact = {}
+        cls._by_endpoint = {}
+
+        with open(cls.record_file, encoding="utf-8") as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                entry["served"] = False
+                cls._exact.setdefault(
+                    (entry["m"], entry["e"], entry["b"]), deque()
+                ).append(entry)
+                cls._by_endpoint.setdefault(
+                    (entry["m"], entry["e"]), deque()
+                ).append(entry)
+
+        logger.info(
+            "Loaded %s recorded requests from %s.",
+            sum(len(entries) for entries in cls._by_endpoint.values()),
+            cls.record_file,
+        )
+
+    @staticmethod
+    def __take(entries: deque | None, reuse_last: bool = False):
+        """
+        Take the first response not served yet.
+
+        Served responses are skipped lazily, as every response is in
+        both indexes. With `reuse_last` the last response is served
+        again for repeated requests.
+        """
+
+        if not entries:
+            return None
+
+        while len(entries) > 1 and entries[0]["served"]:
+            entries.popleft()
+
+        entry = entries[0]
+        if entry["served"] and not reuse_last:
+            return None
+        if len(entries) > 1:
+            entries.popleft()
+
+        entry["served"] = True
+        return entry
@@ -0,0 +1,195 @@
+"""
+This module provides an asyncio utility class for making HTTP requests.
+"""
+
+import asyncio
+import logging as logger
+
+from src.requests_utilities import RequestUtilities, SessionPool
+
+
+# pylint: disable=too-many-arguments
+# pylint: disable=too-many-instance-attributes
+class AsyncRequestUtilities:
+    """
+    An asyncio counterpart of RequestUtilities.
+
+    Every call runs a RequestUtilities request in a worker thread over the
+    shared keep-alive session, so status code checks behave exactly as in
+    the synchronous client. The number of requests in flight is limited
+    by `concurrency` (the HTTP pool size by default).
+
+    Calls run concurrently, so the status code and the response of a call
+    are kept in its own RequestUtilities, see `send`.
+    """
+
+    def __init__(self, concurrency: int | None = None):
+        self.base_url: str = RequestUtilities.get_base_url()
+
+        self.concurrency: int = concurrency or SessionPool.pool_size
+        SessionPool.configure(self.concurrency)
+        self.__semaphores: dict = {}
+
+    def __get_semaphore(self) -> asyncio.Semaphore:
+        """
+        Return the concurrency limit for the running event loop.
+        """
+
+        loop = asyncio.get_running_loop()
+        if loop not in self.__semaphores:
+            self.__semaphores.clear()
+            self.__semaphores[loop] = asyncio.Semaphore(self.concurrency)
+        return self.__semaphores[loop]
+
+    async def send(
+        self,
+        request_utility: RequestUtilities,
+        method: str,
+        headers: dict | None,
+        **kwargs,
+    ):
+        """
+        Run one request of `request_utility` in a worker thread.
+
+        The status code, URL and response of the call are kept in
+        `request_utility`, also when the status code check fails.
+        """
+
+        # Concurrent calls usually share one auth headers dict,
+        # RequestUtilities updates it in place.
+        headers = dict(headers) if headers else None
+
+        return await self.run(
+            getattr(request_utility, method), headers=headers, **kwargs
+        )
+
+    async def run(self, func, *args, **kwargs):
+        """
+        Run a synchronous call, e.g. a helper method, in a worker thread.
+
+        It counts against the concurrency limit like a request.
+        """
+
+        async with self.__get_semaphore():
+            return await asyncio.to_thread(func, *args, **kwargs)
+
+    async def get(
+        self,
+        endpoint: str,
+        headers: dict | None = None,
+        expected_status_code=200,
+        *,
+        max_ms: float | None = None,
+    ):
+        """
+        Perform a GET request to the specified API endpoint.
+        """
+
+        logger.info("Starting async GET method.")
+
+        return await self.send(
+            RequestUtilities(),
+            "get",
+            headers=headers,
+            endpoint=endpoint,
+            expected_status_code=expected_status_code,
+            max_ms=max_ms,
+        )
+
+    async def post(
+        self,
+        endpoint: str,
+        payload: dict | None = None,
+        headers: dict | None = None,
+        expected_status_code=200,
+        *,
+        max_ms: float | None = None,
+    ):
+        """
+        Perform a POST request to the specified API endpoint.
+        """
+
+        logger.info("Starting async POST method.")
+
+        return await self.send(
+            RequestUtilities(),
+            "post",
+            headers=headers,
+            endpoint=endpoint,
+            payload=payload,
+            expected_status_code=expected_status_code,
+            max_ms=max_ms,
+        )
+
+    async def put(
+        self,
+        endpoint: str,
+        payload: dict | None = None,
+        headers: dict | None = None,
+        expected_status_code=200,
+        *,
+        max_ms: float | None = None,
+    ):
+        """
+        Perform a PUT request to the specified API endpoint.
+        """
+
+        logger.info("Starting async PUT method.")
+
+        return await self.send(
+            RequestUtilities(),
+            "put",
+            headers=headers,
+            endpoint=endpoint,
+            payload=payload,
+            expected_status_code=expected_status_code,
+            max_ms=max_ms,
+        )
+
+    async def patch(
+        self,
+        endpoint: str,
+        payload: dict | None = None,
+        headers: dict | None = None,
+        expected_status_code=200,
+        *,
+        max_ms: float | None = None,
+    ):
+        """
+        Perform a PATCH request to the specified API endpoint.
+        """
+
+        logger.info("Starting async PATCH method.")
+
+        return await self.send(
+            RequestUtilities(),
+            "patch",
+            headers=headers,
+            endpoint=endpoint,
+            payload=payload,
+            expected_status_code=expected_status_code,
+            max_ms=max_ms,
+        )
+
+    async def delete(
+        self,
+        endpoint: str,
+        headers: dict | None = None,
+        expected_status_code=200,
+        *,
+        max_ms: float | None = None,
+    ):
+        """
+        Perform a DELETE request to the specified API endpoint.
+        """
+
+        logger.info("Starting async DELETE method.")
+
+        return await self.send(
+            RequestUtilities(),
+            "delete",
+            headers=headers,
+            endpoint=endpoint,
+            expected_status_code=expected_status_code,
+            max_ms=max_ms,
+        )
@@ -0,0 +1,58 @@
+"""
+This module builds WebDriver options for the browser profiles.
+
+- "default": A headed browser with default settings.
+- "lean": A headless browser without images, web fonts and animations
+  that does not wait for subresources to load.
+"""
+
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
+
+BROWSER_PROFILES = ("default", "lean")
+
+
+def firefox_options(
+    profile: str = "default", binary_location: str | None = None
+) -> FirefoxOptions:
+    """
+    Build Firefox options for the profile.
+    """
+
+    options = FirefoxOptions()
+    if binary_location:
+        options.binary_location = binary_location
+
+    if profile == "lean":
+        options.add_argument("-headless")
+        options.page_load_strategy = "eager"
+        options.set_preference("permissions.default.image", 2)
+        options.set_preference("gfx.downloadable_fonts.enabled", False)
+        options.set_preference("browser.display.use_document_fonts", 0)
+        options.set_preference("ui.prefersReducedMotion", 1)
+        options.set_preference("toolkit.cosmeticAnimations.enabled", False)
+        options.set_preference("layers.acceleration.disabled", True)
+
+    return options
+
+
+def chrome_options(profile: str = "default") -> ChromeOptions:
+    """
+    Build Chrome options for the profile.
+    """
+
+    options = ChromeOptions()
+
+    if profile == "lean":
+        options.add_argument("--headless=new")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--disable-extensions")
+        options.add_argument("--disable-remote-fonts")
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_argument("--force-prefers-reduced-motion")
+        options.add_experimental_option(
+            "prefs", {"profile.managed_default_content_settings.images": 2}
+        )
+        options.page_load_strategy = "eager"
+
+    return options
@@ -0,0 +1,158 @@
+"""
+This module provides a pool of WebDriver instances reused between UI tests.
+"""
+
+import logging as logger
+from collections.abc import Callable
+
+from selenium import webdriver
+from selenium.common import WebDriverException
+
+
+class BrowserPool:
+    """
+    A per-process pool of warm WebDriver instances.
+
+    A released driver is reset (cookies, storage, extra windows) and kept
+    for the next test. It is quit after `max_uses` tests, or when it does
+    not respond.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], webdriver.Firefox | webdriver.Chrome],
+        max_uses: int = 20,
+    ):
+        self.factory = factory
+        self.max_uses = max(max_uses, 1)
+
+        self.__idle: list = []
+        self.__uses: dict = {}
+
+        self.launches: int = 0
+        self.reuses: int = 0
+        self.recycles: int = 0
+
+    def acquire(self) -> webdriver.Firefox | webdriver.Chrome:
+        """
+        Return a warm driver, launching a new one if none is available.
+        """
+
+        while self.__idle:
+            driver = self.__idle.pop()
+            if self.__is_alive(driver):
+                logger.info("Reuse browser.")
+                self.reuses += 1
+                return driver
+
+            logger.info("Browser does not respond, launch a new one.")
+            self.__quit(driver)
+
+        logger.info("Launch browser.")
+        driver = self.factory()
+        self.launches += 1
+        self.__uses[driver] = 0
+        return driver
+
+    def release(self, driver: webdriver.Firefox | webdriver.Chrome):
+        """
+        Reset the driver and return it to the pool, or quit it.
+        """
+
+        self.__uses[driver] = self.__uses.get(driver, 0) + 1
+
+        if self.__uses[driver] >= self.max_uses:
+            logger.info("Browser reached %s tests, quit.", self.max_uses)
+            self.__quit(driver)
+            return
+
+        if not self.__reset(driver):
+            logger.info("Browser reset failed, quit.")
+            self.__quit(driver)
+            return
+
+        self.__idle.append(driver)
+
+    def close(self):
+        """
+        Quit all idle drivers.
+        """
+
+        while self.__idle:
+            driver = self.__idle.pop()
+            driver_uses = self.__uses.pop(driver, 0)
+            logger.info("Browser quit after %s tests.", driver_uses)
+            try:
+                driver.quit()
+            except WebDriverException as e:
+                logger.warning("Browser quit failed: %s", e)
+
+    def stats(self) -> dict:
+        """
+        Return the number of launched, reused and recycled drivers.
+        """
+
+        return {
+            "launches": self.launches,
+            "reuses": self.reuses,
+            "recycles": self.recycles,
+        }
+
+    def __quit(self, driver: webdriver.Firefox | webdriver.Chrome):
+        """
+        Quit a driver that is not going back to the pool.
+        """
+
+        self.recycles += 1
+        self.__uses.pop(driver, None)
+        try:
+            driver.quit()
+        except WebDriverException as e:
+            logger.warning("Browser quit failed: %s", e)
+
+    @staticmethod
+    def __is_alive(driver: webdriver.Firefox | webdriver.Chrome) -> bool:
+        """
+        Check that the driver still responds.
+        """
+
+        try:
+            _ = driver.current_url
+        except WebDriverException:
+            return False
+        return True
+
+    @staticmethod
+    def __reset(driver: webdriver.Firefox | webdriver.Chrome) -> bool:
+        """
+        Clear the state left by a test.
+        """
+
+        try:
+            try:
+                driver.switch_to.alert.dismiss()
+            except WebDriverException:
+                pass
+
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+
+            # Cookies and storage can be cleared only for the current site.
+            driver.delete_all_cookies()
+            try:
+                driver.execute_script(
+                    "window.localStorage.clear();"
+                    "window.sessionStorage.clear();"
+                )
+            except WebDriverException:
+                pass
+
+            driver.get("about:blank")
+        except WebDriverException as e:
+            logger.warning("Browser reset failed: %s", e)
+            return False
+
+        return True
@@ -0,0 +1,148 @@
+"""
+This module measures the per-call overhead of RequestUtilities.
+
+Calls go to a stub session that returns a canned response, so only the
+client is timed: the request core, the middleware chain and the
+response checks. Every chain is timed for GET and POST:
+
+    python -m src.client_benchmark --calls 20000
+
+The chains are "bare" (no middleware), "default" (latency stats and
+auth refresh, as in a test session) and "full" (also logging and
+retries).
+"""
+
+import argparse
+import logging as logger
+import time
+from datetime import timedelta
+
+import requests
+
+from src.latency_stats import LatencyStats
+from src.requests_utilities import RequestUtilities
+
+CHAINS = {
+    "bare": {"log": False, "stats": False, "auth": False, "retries": 0},
+    "default": {"log": False, "stats": True, "auth": True, "retries": 0},
+    "full": {"log": True, "stats": True, "auth": True, "retries": 2},
+}
+
+
+class StubSession:  # pylint: disable=too-few-public-methods
+    """
+    A session that answers every request with the same response.
+    """
+
+    def __init__(self):
+        self.response = requests.Response()
+        self.response.status_code = 200
+        # pylint: disable-next=protected-access
+        self.response._content = b'{"_id":"1"}'
+        self.response.headers["Content-Length"] = "11"
+        self.response.elapsed = timedelta(0)
+
+    def request(self, *_args, **_kwargs) -> requests.Response:
+        """
+        Return the canned response.
+        """
+
+        return self.response
+
+
+def measure(call, calls: int, warmup: int = 1000) -> float:
+    """
+    Return the mean time of the call in microseconds.
+    """
+
+    for _ in range(warmup):
+        call()
+
+    start = time.perf_counter()
+    for _ in range(calls):
+        call()
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def run_benchmark(calls: int) -> dict:
+    """
+    Time GET and POST calls through every chain.
+
+    The settings of RequestUtilities and of the root logger
+    are restored afterwards.
+    """
+
+    root = logger.getLogger()
+    saved = (
+        root.level,
+        RequestUtilities.unauthorized_handler,
+        RequestUtilities.retries,
+        LatencyStats.enabled,
+    )
+    # Log records are built but not written.
+    null_handler = logger.NullHandler()
+    handlers, root.handlers = root.handlers, [null_handler]
+
+    request_utility = RequestUtilities()
+    request_utility.session = StubSession()
+    headers = {"Authorization": "Bearer benchmark"}
+
+    results = {}
+    try:
+        for name, chain in CHAINS.items():
+            root.setLevel(logger.INFO if chain["log"] else logger.WARNING)
+            RequestUtilities.unauthorized_handler = (
+                (lambda _headers: False) if chain["auth"] else None
+            )
+            RequestUtilities.retries = chain["retries"]
+            LatencyStats.enabled = chain["stats"]
+
+            results[name] = {
+                "get": measure(
+                    lambda: request_utility.get("contacts/1", headers=headers),
+                    calls,
+                ),
+                "post": measure(
+                    lambda: request_utility.post(
+                        "contacts", payload={"_id": "1"}, headers=headers
+                    ),
+                    calls,
+                ),
+            }
+    finally:
+        root.handlers = handlers
+        (
+            level,
+            RequestUtilities.unauthorized_handler,
+            RequestUtilities.retries,
+            LatencyStats.enabled,
+        ) = saved
+        root.setLevel(level)
+        LatencyStats.reset()
+
+    return results
+
+
+def main(argv: list | None = None):
+    """
+    Run the benchmark from the command line.
+    """
+
+    parser = argparse.ArgumentParser(
+        prog="python -m src.client_benchmark",
+        description=__doc__.split("\n\n", maxsplit=1)[0],
+    )
+    parser.add_argument(
+        "--calls", type=int, default=20000, help="Timed calls per method"
+    )
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(args.calls)
+
+    print(f"{'chain':<8} {'GET, us':>9} {'POST, us':>9}")
+    for name, row in results.items():
+        print(f"{name:<8} {row['get']:>9.2f} {row['post']:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""
+This module resolves WebDriver binaries for the browsers under test.
+"""
+
+import json
+import logging as logger
+import os
+import re
+import shutil
+import subprocess
+import time
+
+DEFAULT_DRIVER_CACHE = os.path.join(
+    os.path.expanduser("~"), ".cache", "its-contacts-app-tests", "drivers.json"
+)
+
+
+class DriverResolver:
+    """
+    Class that finds the WebDriver binary once per session.
+
+    Resolved paths are kept in a cache file keyed by browser name and
+    version. With `driver_dir` drivers are taken only from that
+    directory and the network is never used.
+    """
+
+    DRIVER_NAMES = {"firefox": "geckodriver", "chrome": "chromedriver"}
+    BROWSER_BINARIES = {
+        "firefox": ("firefox",),
+        "chrome": (
+            "google-chrome",
+            "google-chrome-stable",
+            "chromium",
+            "chromium-browser",
+        ),
+    }
+
+    def __init__(
+        self,
+        cache_file: str = DEFAULT_DRIVER_CACHE,
+        driver_dir: str | None = None,
+    ):
+        self.cache_file = cache_file
+        self.driver_dir = driver_dir
+
+        self.__resolved: dict = {}
+        self.resolve_time: float = 0.0
+
+    def resolve(
+        self, browser_name: str, browser_binary: str | None = None
+    ) -> str:
+        """
+        Return the path of the driver for the browser.
+        """
+
+        if browser_name in self.__resolved:
+            return self.__resolved[browser_name]
+
+        start = time.perf_counter()
+        try:
+            if self.driver_dir:
+                path = self.__find_local_driver(browser_name)
+            else:
+                path = self.__find_cached_driver(browser_name, browser_binary)
+        finally:
+            self.resolve_time += time.perf_counter() - start
+
+        logger.info("Driver for %s: %s", browser_name, path)
+        self.__resolved[browser_name] = path
+        return path
+
+    def __find_local_driver(self, browser_name: str) -> str:
+        """
+        Find the driver in the local driver directory.
+        """
+
+        driver_name = self.DRIVER_NAMES[browser_name]
+        path = shutil.which(driver_name, path=self.driver_dir)
+        if path is None:
+            raise FileNotFoundError(
+                f"{driver_name} is not found in {self.driver_dir}"
+            )
+        return path
+
+    def __find_cached_driver(
+        self, browser_name: str, browser_binary: str | None
+    ) -> str:
+        """
+        Find the driver in the cache file, or install it.
+        """
+
+        version = self.get_browser_version(browser_name, browser_binary)
+        key = f"{browser_name}:{version}"
+
+        cache = self.__load_cache()
+        path = cache.get(key)
+        if path and os.path.exists(path):
+            logger.info("Driver for %s is found in cache.", key)
+            return path
+
+        path = self.__install(browser_name)
+
+        # Without a known browser version the next run must check again.
+        if version is not None:
+            cache[key] = path
+            self.__save_cache(cache)
+
+        return path
+
+    @classmethod
+    def get_browser_version(
+        cls, browser_name: str, browser_binary: str | None = None
+    ) -> str | None:
+        """
+        Read the browser version from `<browser> --version`.
+        """
+
+        binaries = (browser_binary,) if browser_binary else ()
+        for binary in binaries + cls.BROWSER_BINARIES[browser_name]:
+            if not shutil.which(binary):
+                continue
+            try:
+                output = subprocess.run(
+                    [binary, "--version"],
+                    capture_output=True,
+                    text=True,
+                    timeout=10,
+                    check=False,
+                ).stdout
+            except (OSError, subprocess.TimeoutExpired):
+                continue
+
+            match = re.search(r"\d+(\.\d+)+", output)
+            if match:
+                return match.group()
+
+        return None
+
+    @staticmethod
+    def __install(browser_name: str) -> str:
+        """
+        Download the driver with webdriver_manager.
+        """
+
+        # pylint: disable=import-outside-toplevel
+        if browser_name == "firefox":
+            from webdriver_manager.firefox import GeckoDriverManager
+
+            return GeckoDriverManager().install()
+
+        from webdriver_manager.chrome import ChromeDriverManager
+
+        return ChromeDriverManager().install()
+
+    def __load_cache(self) -> dict:
+        """
+        Load resolved driver paths from the cache file.
+        """
+
+        try:
+            with open(self.cache_file, encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def __save_cache(self, cache: dict):
+        """
+        Write resolved driver paths to the cache file.
+
+        The file is written under a temporary name and then replaced,
+        so parallel workers never read a partly written file.
+        """
+
+        tmp_file = f"{self.cache_file}.{os.getpid()}.tmp"
+        try:
+            directory = os.path.dirname(self.cache_file)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(tmp_file, "w", encoding="utf-8") as file:
+                json.dump(cache, file, indent=2)
+            os.replace(tmp_file, self.cache_file)
+        except OSError as e:
+            logger.warning("Driver cache is not saved: %s", e)
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
@@ -0,0 +1,188 @@
+"""
+This module provides asyncio utility functions for working with contacts.
+"""
+
+import asyncio
+import logging as logger
+import time
+
+from src.async_requests_utilities import AsyncRequestUtilities
+from src.helpers.contacts_helper import ContactsHelper
+
+
+class AsyncContactsHelper:
+    """
+    Class with asyncio methods for contacts.
+    """
+
+    def __init__(self, concurrency: int | None = None):
+        self.request_utility = AsyncRequestUtilities(concurrency=concurrency)
+        self.full_contact: int = 11
+
+    async def create_contact(self, auth_headers: dict):
+        """
+        Method for creating new contact.
+        """
+
+        logger.info("Create new contact.")
+        payload = ContactsHelper.generate_contact_payload()
+
+        create_contact_json = await self.request_utility.post(
+            endpoint="contacts",
+            payload=payload,
+            headers=auth_headers,
+            expected_status_code=201,
+        )
+
+        return create_contact_json, payload
+
+    async def create_contacts(
+        self,
+        auth_headers: dict,
+        count: int,
+        concurrency: int | None = None,
+    ):
+        """
+        Method for creating several contacts concurrently.
+
+        Works like ContactsHelper.create_contacts: payloads are generated
+        before the first request is sent, returns the ids of created
+        contacts and timing stats. `concurrency` can only lower the
+        limit of the helper.
+        """
+
+        limit = self.request_utility.concurrency
+        concurrency = min(concurrency or limit, limit)
+        logger.info(
+            "Create %s new contacts with %s workers.", count, concurrency
+        )
+
+        payloads = [
+            ContactsHelper.generate_contact_payload() for _ in range(count)
+        ]
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def create(payload: dict):
+            async with semaphore:
+                start = time.perf_counter()
+                try:
+                    create_contact_json = await self.request_utility.post(
+                        endpoint="contacts",
+                        payload=payload,
+                        headers=auth_headers,
+                        expected_status_code=201,
+                    )
+                # pylint: disable-next=broad-exception-caught
+                except Exception as e:
+                    logger.error("Error while trying to create contact: %s", e)
+                    return None, time.perf_counter() - start
+
+                return create_contact_json["_id"], time.perf_counter() - start
+
+        start = time.perf_counter()
+        results = await asyncio.gather(*(create(p) for p in payloads))
+        total = time.perf_counter() - start
+
+        return ContactsHelper.summarize_bulk(results, concurrency, total)
+
+    async def delete_contact(
+        self, auth_headers: dict, contact_id: str, missing_ok: bool = False
+    ):
+        """
+        Method for deleting contact.
+
+        With `missing_ok` a 404 response means the contact
+        is already deleted.
+        """
+
+        await self.request_utility.run(
+            ContactsHelper().delete_contact,
+            auth_headers=dict(auth_headers),
+            contact_id=contact_id,
+            missing_ok=missing_ok,
+        )
+
+    async def delete_contacts(
+        self, auth_headers: dict, contact_ids: list, missing_ok: bool = False
+    ):
+        """
+        Method for deleting several contacts concurrently.
+
+        Returns the exception raised for every contact
+        (None if the contact was deleted).
+        """
+
+        logger.info("Delete %s contacts.", len(contact_ids))
+
+        return await asyncio.gather(
+            *(
+                self.delete_contact(
+                    auth_headers=auth_headers,
+                    contact_id=contact_id,
+                    missing_ok=missing_ok,
+                )
+                for contact_id in contact_ids
+            ),
+            return_exceptions=True,
+        )
+
+    async def get_contacts(
+        self,
+        auth_headers: dict,
+        contact_id: str | None = None,
+        expected_status_code: int = 200,
+    ):
+        """
+        Method to get list of contacts.
+        """
+
+        if contact_id is None:
+            logger.info("Get contacts")
+
+            return await self.request_utility.get(
+                endpoint="contacts",
+                headers=auth_headers,
+                expected_status_code=expected_status_code,
+            )
+
+        logger.info("Get contact by id=%s", contact_id)
+
+        return await self.request_utility.get(
+            endpoint=f"contacts/{contact_id}",
+            headers=auth_headers,
+            expected_status_code=expected_status_code,
+        )
+
+    async def update(
+        self,
+        auth_headers: dict,
+        payload: dict,
+        contact_id: str,
+        expected_status_code: int = 200,
+    ):
+        """
+        Method to update contact.
+        """
+
+        if len(payload) == self.full_contact:
+            logger.info("Update contact with PUT.")
+
+            return await self.request_utility.put(
+                endpoint=f"contacts/{contact_id}",
+                payload=payload,
+                headers=auth_headers,
+                expected_status_code=expected_status_code,
+            )
+
+        if len(payload) < self.full_contact:
+            logger.info("Update contact with PATCH.")
+
+            return await self.request_utility.patch(
+                endpoint=f"contacts/{contact_id}",
+                payload=payload,
+                headers=auth_headers,
+                expected_status_code=expected_status_code,
+            )
+
+        logger.info("Payload length does not match any expected condition.")
+        return None
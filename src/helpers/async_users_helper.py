@@ -0,0 +1,108 @@
+"""
+This module provides asyncio utility functions for working with users.
+"""
+
+import asyncio
+import logging as logger
+
+from src.async_requests_utilities import AsyncRequestUtilities
+from src.helpers.users_helper import UsersHelper
+
+
+class AsyncUsersHelper:
+    """
+    Class with asyncio methods for users.
+    """
+
+    def __init__(self, concurrency: int | None = None):
+        self.request_utility = AsyncRequestUtilities(concurrency=concurrency)
+
+    async def create_user(self, auth_headers: dict):
+        """
+        Method for creating new user.
+        """
+
+        logger.info("Create new user.")
+        payload = UsersHelper.generate_user_payload()
+
+        create_user_json = await self.request_utility.post(
+            endpoint="users",
+            payload=payload,
+            headers=auth_headers,
+            expected_status_code=201,
+        )
+
+        return create_user_json, payload
+
+    async def create_users(self, auth_headers: dict, count: int):
+        """
+        Method for creating several users concurrently.
+
+        If a user is not created, the created ones are deleted
+        and the first error is raised.
+        """
+
+        logger.info("Create %s new users.", count)
+
+        results = await asyncio.gather(
+            *(self.create_user(auth_headers) for _ in range(count)),
+            return_exceptions=True,
+        )
+
+        errors = [
+            result for result in results if isinstance(result, BaseException)
+        ]
+        if not errors:
+            return results
+
+        logger.info("%s users failed, delete created users.", len(errors))
+        await asyncio.gather(
+            *(
+                self.delete_user(
+                    auth_headers={
+                        "Authorization": f"Bearer {result[0]['token']}"
+                    }
+                )
+                for result in results
+                if not isinstance(result, BaseException)
+            ),
+            return_exceptions=True,
+        )
+        raise errors[0]
+
+    async def delete_user(self, auth_headers: dict):
+        """
+        Method for deleting user.
+        """
+
+        logger.info("Delete user.")
+
+        await self.request_utility.delete(
+            endpoint="users/me", headers=auth_headers
+        )
+
+    async def get_user(self, auth_headers: dict):
+        """
+        Method for getting user.
+        """
+
+        logger.info("Get user.")
+
+        return await self.request_utility.get(
+            endpoint="users/me", headers=auth_headers
+        )
+
+    async def update_user(self, auth_headers: dict):
+        """
+        Method for updating user.
+        """
+
+        logger.info("Update user.")
+
+        payload = UsersHelper.generate_user_payload()
+
+        update_user_json = await self.request_utility.patch(
+            endpoint="users/me", payload=payload, headers=auth_headers
+        )
+
+        return update_user_json, payload
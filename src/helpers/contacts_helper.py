@@ -2,11 +2,15 @@
 This module provides utility functions for working with contacts.
 """
 
-import logging as logger
+# pylint: disable=too-many-arguments
 
-from faker import Faker
+import logging as logger
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
 
-from src.requests_utilities import RequestUtilities
+from src.payload_factory import PayloadFactory
+from src.requests_utilities import RequestUtilities, SessionPool
 
 
 class ContactsHelper:
@@ -18,29 +22,30 @@ class ContactsHelper:
         self.request_utility = RequestUtilities()
         self.full_contact: int = 11
 
-    def create_contact(self, auth_headers: dict):
+    @staticmethod
+    def generate_contact_payload() -> dict:
+        """
+        Method for generating fake contact data.
+        """
+
+        return PayloadFactory.contact()
+
+    def create_contact(
+        self,
+        auth_headers: dict,
+        payload: dict | None = None,
+        *,
+        max_ms: float | None = None,
+    ):
         """
         Method for creating new contact.
+
+        A fake payload is generated if no payload is given.
         """
 
         logger.info("Create new contact.")
-        fake = Faker()
-
-        payload = {
-            "firstName": fake.first_name(),
-            "lastName": fake.last_name(),
-            "birthdate": (
-                fake.date_of_birth(minimum_age=6, maximum_age=110)
-            ).strftime("%Y-%m-%d"),
-            "email": fake.email(),
-            "phone": fake.basic_phone_number(),
-            "street1": fake.street_name(),
-            "street2": fake.street_name(),
-            "city": fake.city(),
-            "stateProvince": fake.state(),
-            "postalCode": fake.postalcode(),
-            "country": fake.country(),
-        }
+        if payload is None:
+            payload = self.generate_contact_payload()
 
         logger.info("Fake contact created")
 
@@ -49,26 +54,195 @@ class ContactsHelper:
             payload=payload,
             headers=auth_headers,
             expected_status_code=201,
+            max_ms=max_ms,
         )
 
         return create_contact_json, payload
 
-    def delete_contact(self, auth_headers: dict, contact_id: str):
+    def create_contacts(
+        self,
+        auth_headers: dict,
+        count: int,
+        concurrency: int | None = None,
+    ):
+        """
+        Method for creating many contacts through a pool of workers.
+
+        Payloads are generated before the first request is sent.
+        Returns the ids of created contacts and timing stats,
+        failed contacts are counted in the stats.
+        """
+
+        concurrency = concurrency or SessionPool.pool_size
+        SessionPool.configure(concurrency)
+        logger.info(
+            "Create %s new contacts with %s workers.", count, concurrency
+        )
+
+        payloads = [self.generate_contact_payload() for _ in range(count)]
+
+        def create(payload: dict):
+            request_utility = RequestUtilities()
+            start = time.perf_counter()
+            try:
+                create_contact_json = request_utility.post(
+                    endpoint="contacts",
+                    payload=payload,
+                    headers=dict(auth_headers),
+                    expected_status_code=201,
+                )
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.error("Error while trying to create contact: %s", e)
+                return None, time.perf_counter() - start
+
+            return create_contact_json["_id"], time.perf_counter() - start
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = list(executor.map(create, payloads))
+        total = time.perf_counter() - start
+
+        return self.summarize_bulk(results, concurrency, total)
+
+    @staticmethod
+    def summarize_bulk(results: list, concurrency: int, total: float):
+        """
+        Build the result of a bulk creation from (id, seconds) pairs.
+
+        The id is None for a contact that was not created.
+        Returns the ids of created contacts and timing stats.
+        """
+
+        created_ids = [
+            contact_id for contact_id, _ in results if contact_id is not None
+        ]
+        latencies = sorted(latency for _, latency in results)
+
+        latencies_ms = [latency * 1000 for latency in latencies] or [0]
+
+        stats = {
+            "requested": len(results),
+            "created": len(created_ids),
+            "failed": len(results) - len(created_ids),
+            "concurrency": concurrency,
+            "total_s": round(total, 3),
+            "contacts_per_s": round(len(created_ids) / total, 1),
+            "latency_avg_ms": round(statistics.fmean(latencies_ms), 1),
+            "latency_p95_ms": round(
+                latencies_ms[int(0.95 * (len(latencies_ms) - 1))], 1
+            ),
+            "latency_max_ms": round(latencies_ms[-1], 1),
+        }
+
+        logger.info("Bulk contact creation stats: %s", stats)
+
+        return created_ids, stats
+
+    def delete_contact(
+        self,
+        auth_headers: dict,
+        contact_id: str,
+        expected_status_code: int = 200,
+        *,
+        missing_ok: bool = False,
+        max_ms: float | None = None,
+    ):
         """
         Method for deleting contact.
+
+        With `missing_ok` a 404 response means the contact
+        is already deleted.
         """
 
         logger.info("Delete contact id=%s", contact_id)
 
-        self.request_utility.delete(
-            endpoint=f"contacts/{contact_id}", headers=auth_headers
+        try:
+            self.request_utility.delete(
+                endpoint=f"contacts/{contact_id}",
+                headers=auth_headers,
+                expected_status_code=expected_status_code,
+                max_ms=max_ms,
+            )
+        except AssertionError:
+            if missing_ok and self.request_utility.status_code == 404:
+                logger.info("Contact %s already deleted.", contact_id)
+                return
+            raise
+
+    def delete_contacts(
+        self,
+        auth_headers: dict,
+        contact_ids: list,
+        workers: int | None = None,
+    ):
+        """
+        Method for deleting contacts through a pool of workers.
+
+        Returns the list of ids that could not be deleted.
+        """
+
+        workers = workers or SessionPool.pool_size
+        SessionPool.configure(workers)
+        logger.info(
+            "Delete %s contacts with %s workers.", len(contact_ids), workers
         )
 
+        def delete(contact_id: str):
+            try:
+                ContactsHelper().delete_contact(
+                    auth_headers=dict(auth_headers), contact_id=contact_id
+                )
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.error(
+                    "Error while trying to delete contact %s: %s",
+                    contact_id,
+                    e,
+                )
+                return contact_id
+            return None
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(delete, contact_ids))
+
+        return [contact_id for contact_id in results if contact_id]
+
+    def delete_all_contacts(
+        self, auth_headers: dict, workers: int | None = None
+    ):
+        """
+        Method for deleting every contact of the user.
+        """
+
+        logger.info("Delete all contacts.")
+
+        deleted = 0
+        while True:
+            contacts = self.get_contacts(auth_headers=auth_headers) or []
+            contact_ids = [contact["_id"] for contact in contacts]
+            if not contact_ids:
+                break
+
+            failed = self.delete_contacts(
+                auth_headers=auth_headers,
+                contact_ids=contact_ids,
+                workers=workers,
+            )
+            deleted += len(contact_ids) - len(failed)
+
+            if len(failed) == len(contact_ids):
+                logger.error("Contacts were not deleted: %s", failed)
+                break
+
+        logger.info("Deleted %s contacts.", deleted)
+        return deleted
+
     def get_contacts(
         self,
         auth_headers: dict,
         contact_id: str | None = None,
         expected_status_code: int = 200,
+        *,
+        max_ms: float | None = None,
     ):
         """
         Method to get list of contacts.
@@ -81,6 +255,7 @@ class ContactsHelper:
                 endpoint="contacts",
                 headers=auth_headers,
                 expected_status_code=expected_status_code,
+                max_ms=max_ms,
             )
             return rs_get_contacts
 
@@ -90,6 +265,7 @@ class ContactsHelper:
             endpoint=f"contacts/{contact_id}",
             headers=auth_headers,
             expected_status_code=expected_status_code,
+            max_ms=max_ms,
         )
         return rs_get_contact
 
@@ -99,6 +275,8 @@ class ContactsHelper:
         payload: dict,
         contact_id: str,
         expected_status_code: int = 200,
+        *,
+        max_ms: float | None = None,
     ):
         """
         Method to update contact.
@@ -112,6 +290,7 @@ class ContactsHelper:
                 payload=payload,
                 headers=auth_headers,
                 expected_status_code=expected_status_code,
+                max_ms=max_ms,
             )
             return rs_update_contact
 
@@ -123,6 +302,7 @@ class ContactsHelper:
                 payload=payload,
                 headers=auth_headers,
                 expected_status_code=expected_status_code,
+                max_ms=max_ms,
             )
             return rs_update_contact
 
@@ -0,0 +1,249 @@
+"""
+This module provides a process-wide cache of API bearer tokens.
+"""
+
+import base64
+import binascii
+import json
+import logging as logger
+import os
+import threading
+import time
+
+from src.requests_utilities import RequestUtilities
+
+
+class TokenBroker:
+    """
+    Class that logs in once per process and shares the bearer token.
+
+    Tokens are cached with their expiry and refreshed when the API
+    answers 401. With a cache file tokens survive between runs,
+    the file is readable only by its owner.
+
+    The browser auth cookie gets a token of its own, so a UI test
+    that logs out never revokes the token of API calls.
+    """
+
+    _lock = threading.RLock()
+    _tokens: dict = {}
+    _browser_tokens: dict = {}
+    _passwords: dict = {}
+    _issued: dict = {}
+
+    cache_file: str | None = None
+    login_count: int = 0
+    refresh_margin: int = 60
+
+    @classmethod
+    def configure(cls, cache_file: str | None = None):
+        """
+        Set the token cache file and enable refreshing on 401.
+        """
+
+        cls.cache_file = cache_file
+        if cache_file:
+            cls.__load()
+
+        RequestUtilities.unauthorized_handler = cls.refresh_headers
+
+    @classmethod
+    def get_token(cls, email: str, password: str) -> str:
+        """
+        Return a valid token for the user, logging in if needed.
+        """
+
+        with cls._lock:
+            cls._passwords[email] = password
+
+            cached = cls._tokens.get(email)
+            if cached and not cls.__is_expired(cached["exp"]):
+                return cached["token"]
+
+            return cls.__login(email)
+
+    @classmethod
+    def get_headers(cls, email: str, password: str) -> dict:
+        """
+        Return authorization headers for the user.
+        """
+
+        return {"Authorization": f"Bearer {cls.get_token(email, password)}"}
+
+    @classmethod
+    def get_browser_token(cls, email: str, password: str) -> str:
+        """
+        Return a valid token for the browser auth cookie.
+
+        It comes from a separate login and is not shared with API calls.
+        Like a session of the login form it is not logged out by `logout`.
+        """
+
+        with cls._lock:
+            cls._passwords[email] = password
+
+            cached = cls._browser_tokens.get(email)
+            if cached and not cls.__is_expired(cached["exp"]):
+                return cached["token"]
+
+            token = cls.__request_token(email)
+            cls._browser_tokens[email] = {
+                "token": token,
+                "exp": cls.__get_expiry(token),
+            }
+            return token
+
+    @classmethod
+    def refresh_headers(cls, headers: dict) -> bool:
+        """
+        Replace an expired token in the headers with a new one.
+
+        Returns False if the token was not issued by the broker.
+        """
+
+        stale_token = headers.get("Authorization", "").removeprefix("Bearer ")
+
+        with cls._lock:
+            email = cls._issued.get(stale_token)
+            if email is None or email not in cls._passwords:
+                return False
+
+            token = cls._tokens[email]["token"]
+            if token == stale_token:
+                logger.info("Token of %s expired, login again.", email)
+                token = cls.__login(email)
+
+            headers["Authorization"] = f"Bearer {token}"
+            return True
+
+    @classmethod
+    def logout(cls):
+        """
+        Logout all cached tokens unless they are kept in the cache file.
+        """
+
+        if cls.cache_file:
+            return
+
+        with cls._lock:
+            request_utility = RequestUtilities()
+            for email, cached in cls._tokens.items():
+                logger.info("Logout %s.", email)
+                request_utility.post(
+                    endpoint="users/logout",
+                    headers={"Authorization": f"Bearer {cached['token']}"},
+                )
+            cls._tokens.clear()
+
+    @classmethod
+    def forget(cls, email: str):
+        """
+        Drop the tokens of a deleted account, also from the cache file.
+        """
+
+        with cls._lock:
+            for tokens in (cls._tokens, cls._browser_tokens):
+                cached = tokens.pop(email, None)
+                if cached:
+                    cls._issued.pop(cached["token"], None)
+            cls._passwords.pop(email, None)
+
+            if cls.cache_file:
+                cls.__save()
+
+    @classmethod
+    def __login(cls, email: str) -> str:
+        """
+        Login through the API and cache the token.
+        """
+
+        token = cls.__request_token(email)
+        cls._tokens[email] = {"token": token, "exp": cls.__get_expiry(token)}
+        cls._issued[token] = email
+
+        if cls.cache_file:
+            cls.__save()
+
+        return token
+
+    @classmethod
+    def __request_token(cls, email: str) -> str:
+        """
+        Login through the API and return the new token.
+        """
+
+        logger.info("Login with %s.", email)
+
+        response_json = RequestUtilities().post(
+            endpoint="users/login",
+            payload={"email": email, "password": cls._passwords[email]},
+        )
+        assert (
+            response_json is not None
+        ), "Response is None, but expected JSON response."
+
+        cls.login_count += 1
+        return response_json["token"]
+
+    @classmethod
+    def __is_expired(cls, exp: float | None) -> bool:
+        """
+        Check if the token expires within the refresh margin.
+        """
+
+        if exp is None:
+            return False
+        return exp - cls.refresh_margin <= time.time()
+
+    @staticmethod
+    def __get_expiry(token: str) -> float | None:
+        """
+        Read the expiry time from the JWT payload.
+        """
+
+        try:
+            payload = token.split(".")[1]
+            payload += "=" * (-len(payload) % 4)
+            claims = json.loads(base64.urlsafe_b64decode(payload))
+        except (IndexError, ValueError, binascii.Error):
+            return None
+
+        exp = claims.get("exp") if isinstance(claims, dict) else None
+        return float(exp) if exp is not None else None
+
+    @classmethod
+    def __load(cls):
+        """
+        Load cached tokens from the cache file.
+
+        Expired tokens are dropped, e.g. those of deleted accounts.
+        """
+
+        if not cls.cache_file or not os.path.exists(cls.cache_file):
+            return
+
+        try:
+            with open(cls.cache_file, encoding="utf-8") as file:
+                tokens = json.load(file)
+        except (OSError, ValueError) as e:
+            logger.warning("Token cache is not loaded: %s", e)
+            return
+
+        for email, cached in tokens.items():
+            if cls.__is_expired(cached["exp"]):
+                continue
+            cls._tokens[email] = cached
+            cls._issued[cached["token"]] = email
+
+    @classmethod
+    def __save(cls):
+        """
+        Write cached tokens to the cache file with 0600 permissions.
+        """
+
+        fd = os.open(
+            cls.cache_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600
+        )
+        os.fchmod(fd, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            json.dump(cls._tokens, file)
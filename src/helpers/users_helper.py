@@ -3,8 +3,8 @@ This module provides utility functions for working with users.
 """
 
 import logging as logger
-from faker import Faker
 
+from src.payload_factory import PayloadFactory
 from src.requests_utilities import RequestUtilities
 
 
@@ -16,19 +16,21 @@ class UsersHelper:
     def __init__(self):
         self.request_utility = RequestUtilities()
 
-    def create_user(self, auth_headers: dict):
+    @staticmethod
+    def generate_user_payload() -> dict:
+        """
+        Method for generating fake user data.
+        """
+
+        return PayloadFactory.user()
+
+    def create_user(self, auth_headers: dict, *, max_ms: float | None = None):
         """
         Method for creating new user.
         """
 
         logger.info("Create new user.")
-        fake = Faker()
-        payload = {
-            "firstName": fake.first_name(),
-            "lastName": fake.last_name(),
-            "email": fake.email(),
-            "password": fake.password(length=8, special_chars=False),
-        }
+        payload = self.generate_user_payload()
 
         logger.info(
             "Fake user first name: %s, "
@@ -43,20 +45,23 @@ class UsersHelper:
             payload=payload,
             headers=auth_headers,
             expected_status_code=201,
+            max_ms=max_ms,
         )
 
         return create_user_json, payload
 
-    def delete_user(self, auth_headers: dict):
+    def delete_user(self, auth_headers: dict, *, max_ms: float | None = None):
         """
         Method for deleting user.
         """
 
         logger.info("Delete user.")
 
-        self.request_utility.delete(endpoint="users/me", headers=auth_headers)
+        self.request_utility.delete(
+            endpoint="users/me", headers=auth_headers, max_ms=max_ms
+        )
 
-    def get_user(self, auth_headers: dict):
+    def get_user(self, auth_headers: dict, *, max_ms: float | None = None):
         """
         Method for getting user.
         """
@@ -64,25 +69,19 @@ class UsersHelper:
         logger.info("Get user.")
 
         rs_user_info = self.request_utility.get(
-            endpoint="users/me", headers=auth_headers
+            endpoint="users/me", headers=auth_headers, max_ms=max_ms
         )
 
         return rs_user_info
 
-    def update_user(self, auth_headers: dict):
+    def update_user(self, auth_headers: dict, *, max_ms: float | None = None):
         """
         Method for updating user.
         """
 
         logger.info("Update user.")
 
-        fake = Faker()
-        payload = {
-            "firstName": fake.first_name(),
-            "lastName": fake.last_name(),
-            "email": fake.email(),
-            "password": fake.password(length=8, special_chars=False),
-        }
+        payload = self.generate_user_payload()
 
         logger.info(
             "Fake user update first name: %s, "
@@ -94,7 +93,10 @@ class UsersHelper:
         )
 
         create_user_json = self.request_utility.patch(
-            endpoint="users/me", payload=payload, headers=auth_headers
+            endpoint="users/me",
+            payload=payload,
+            headers=auth_headers,
+            max_ms=max_ms,
         )
 
         return create_user_json, payload
@@ -4,10 +4,37 @@ This module contains host addresses for different environments.
 - "test": The testing environment.
 - "dev": The development environment.
 - "prod": The production environment.
+- "local": The in-process stand-in API from `src.local_api`.
 """
 
+import os
+
+# Every pytest-xdist worker serves its own local API on the next ports.
+_worker = os.getenv("PYTEST_XDIST_WORKER")
+LOCAL_API_PORT = int(os.getenv("LOCAL_API_PORT", "8765")) + (
+    int(_worker.removeprefix("gw")) + 1 if _worker else 0
+)
+
 API_HOSTS = {
     "test": "https://thinking-tester-contact-list.herokuapp.com/",
     "dev": "",
     "prod": "",
+    "local": f"http://127.0.0.1:{LOCAL_API_PORT}/",
+}
+
+# Latency budgets of API calls in ms, keyed by "<METHOD> <endpoint>"
+# with ids replaced by {id}. A `max_ms` argument of a call overrides it.
+LATENCY_BUDGETS = {
+    "POST users": 3000,
+    "GET users/me": 1500,
+    "PATCH users/me": 2000,
+    "DELETE users/me": 2000,
+    "POST users/login": 2000,
+    "POST users/logout": 1500,
+    "GET contacts": 2000,
+    "POST contacts": 2000,
+    "GET contacts/{id}": 1500,
+    "PUT contacts/{id}": 2000,
+    "PATCH contacts/{id}": 2000,
+    "DELETE contacts/{id}": 1500,
 }
@@ -0,0 +1,332 @@
+"""
+This module collects per-endpoint latency histograms of API calls.
+"""
+
+import logging as logger
+import math
+import os
+import re
+import threading
+
+from src.hosts_config import LATENCY_BUDGETS
+
+# Path segments that are ids, e.g. MongoDB ObjectIds.
+ID_SEGMENT_PATTERN = re.compile(r"^(?:[0-9a-f]{24}|\d+)$")
+
+
+def normalize_endpoint(endpoint: str) -> str:
+    """
+    Replace ids in the endpoint with {id}, e.g. "contacts/{id}".
+    """
+
+    path = endpoint.split("?", 1)[0].strip("/")
+    return "/".join(
+        "{id}" if ID_SEGMENT_PATTERN.match(segment) else segment
+        for segment in path.split("/")
+    )
+
+
+class LatencyHistogram:
+    """
+    A fixed-size histogram with logarithmic buckets.
+
+    Every bucket is `growth` times wider than the previous one, so
+    percentiles are accurate within that ratio and the memory does not
+    depend on the number of calls.
+    """
+
+    min_ms: float = 0.1
+    max_ms: float = 120_000.0
+    growth: float = 1.1
+
+    def __init__(self):
+        self.size = int(math.log(self.max_ms / self.min_ms, self.growth)) + 2
+        self.buckets = [0] * self.size
+
+        self.count: int = 0
+        self.total_ms: float = 0.0
+        self.max_seen_ms: float = 0.0
+
+    def add(self, value_ms: float):
+        """
+        Count one value.
+        """
+
+        if value_ms <= self.min_ms:
+            index = 0
+        else:
+            index = min(
+                int(math.log(value_ms / self.min_ms, self.growth)) + 1,
+                self.size - 1,
+            )
+
+        self.buckets[index] += 1
+        self.count += 1
+        self.total_ms += value_ms
+        self.max_seen_ms = max(self.max_seen_ms, value_ms)
+
+    def merge(self, other: "LatencyHistogram"):
+        """
+        Add the counts of another histogram.
+        """
+
+        for index, bucket_count in enumerate(other.buckets):
+            self.buckets[index] += bucket_count
+        self.count += other.count
+        self.total_ms += other.total_ms
+        self.max_seen_ms = max(self.max_seen_ms, other.max_seen_ms)
+
+    def percentile(self, percent: float) -> float:
+        """
+        Return the upper bound of the bucket with the percentile.
+        """
+
+        if not self.count:
+            return 0.0
+
+        rank = math.ceil(self.count * percent / 100)
+        seen = 0
+        for index, bucket_count in enumerate(self.buckets):
+            seen += bucket_count
+            if seen >= rank:
+                upper_bound = self.min_ms * self.growth**index
+                return min(upper_bound, self.max_seen_ms)
+
+        return self.max_seen_ms
+
+    def to_dict(self) -> dict:
+        """
+        Export the histogram, e.g. to send it from a pytest-xdist worker.
+        """
+
+        return {
+            "buckets": {
+                index: bucket_count
+                for index, bucket_count in enumerate(self.buckets)
+                if bucket_count
+            },
+            "count": self.count,
+            "total_ms": self.total_ms,
+            "max_ms": self.max_seen_ms,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LatencyHistogram":
+        """
+        Build a histogram exported with `to_dict`.
+        """
+
+        histogram = cls()
+        for index, bucket_count in data["buckets"].items():
+            histogram.buckets[int(index)] = bucket_count
+        histogram.count = data["count"]
+        histogram.total_ms = data["total_ms"]
+        histogram.max_seen_ms = data["max_ms"]
+        return histogram
+
+
+class LatencyStats:
+    """
+    A process-wide registry of latency histograms.
+
+    Every method and normalized endpoint has a histogram of the total
+    call time and of the time to the response headers (TTFB).
+    """
+
+    _lock = threading.Lock()
+    _histograms: dict = {}
+
+    # Timing is skipped by the request core when disabled.
+    enabled: bool = os.getenv("API_LATENCY_STATS", "1") != "0"
+
+    @classmethod
+    def record(
+        cls, method: str, endpoint: str, total_ms: float, ttfb_ms: float
+    ):
+        """
+        Add the timings of one API call.
+        """
+
+        key = (method, normalize_endpoint(endpoint))
+        with cls._lock:
+            if key not in cls._histograms:
+                cls._histograms[key] = {
+                    "total": LatencyHistogram(),
+                    "ttfb": LatencyHistogram(),
+                }
+            cls._histograms[key]["total"].add(total_ms)
+            cls._histograms[key]["ttfb"].add(ttfb_ms)
+
+    @classmethod
+    def summary(cls) -> list:
+        """
+        Return percentiles of every endpoint, the slowest first.
+        """
+
+        with cls._lock:
+            rows = [
+                {
+                    "method": method,
+                    "endpoint": endpoint,
+                    "calls": histograms["total"].count,
+                    "p50": histograms["total"].percentile(50),
+                    "p95": histograms["total"].percentile(95),
+                    "p99": histograms["total"].percentile(99),
+                    "max": histograms["total"].max_seen_ms,
+                    "ttfb_p50": histograms["ttfb"].percentile(50),
+                }
+                for (method, endpoint), histograms in cls._histograms.items()
+            ]
+        return sorted(rows, key=lambda row: row["p95"], reverse=True)
+
+    @classmethod
+    def export(cls) -> list:
+        """
+        Export all histograms as JSON-serializable data.
+        """
+
+        with cls._lock:
+            return [
+                {
+                    "method": method,
+                    "endpoint": endpoint,
+                    "total": histograms["total"].to_dict(),
+                    "ttfb": histograms["ttfb"].to_dict(),
+                }
+                for (method, endpoint), histograms in cls._histograms.items()
+            ]
+
+    @classmethod
+    def merge(cls, exported: list):
+        """
+        Add histograms exported by another process.
+        """
+
+        with cls._lock:
+            for item in exported:
+                key = (item["method"], item["endpoint"])
+                if key not in cls._histograms:
+                    cls._histograms[key] = {
+                        "total": LatencyHistogram(),
+                        "ttfb": LatencyHistogram(),
+                    }
+                for name in ("total", "ttfb"):
+                    cls._histograms[key][name].merge(
+                        LatencyHistogram.from_dict(item[name])
+                    )
+
+    @classmethod
+    def reset(cls):
+        """
+        Drop all collected timings.
+        """
+
+        with cls._lock:
+            cls._histograms.clear()
+
+
+class LatencyBudget:
+    """
+    A process-wide record of API calls slower than their budget.
+
+    A call is checked against its own `max_ms`, or the budget of its
+    method and endpoint in LATENCY_BUDGETS. With `strict` a breach
+    fails the call. Breaches are counted per call, and only the first
+    `max_samples` are kept with their details. The first breach of
+    every call is logged.
+    """
+
+    _lock = threading.Lock()
+    _counts: dict = {}
+    _samples: list = []
+
+    strict: bool = False
+    max_samples: int = 100
+
+    @classmethod
+    def check(
+        cls,
+        method: str,
+        endpoint: str,
+        elapsed_ms: float,
+        max_ms: float | None = None,
+    ) -> str | None:
+        """
+        Record a breach of the budget and return its description.
+        """
+
+        call = f"{method} {normalize_endpoint(endpoint)}"
+        budget_ms = max_ms if max_ms is not None else LATENCY_BUDGETS.get(call)
+        if budget_ms is None or elapsed_ms <= budget_ms:
+            return None
+
+        message = (
+            f"Latency budget exceeded: {call} took {elapsed_ms:.0f} ms, "
+            f"budget {budget_ms:g} ms"
+        )
+        test = os.getenv("PYTEST_CURRENT_TEST", "").split(" ")[0]
+
+        with cls._lock:
+            count = cls._counts[call] = cls._counts.get(call, 0) + 1
+            if len(cls._samples) < cls.max_samples:
+                cls._samples.append(
+                    {
+                        "call": call,
+                        "elapsed_ms": elapsed_ms,
+                        "budget_ms": budget_ms,
+                        "test": test,
+                    }
+                )
+
+        if count == 1:
+            logger.warning("%s, further breaches are counted.", message)
+        return message
+
+    @classmethod
+    def breaches(cls) -> list:
+        """
+        Return the recorded breach samples.
+        """
+
+        with cls._lock:
+            return list(cls._samples)
+
+    @classmethod
+    def counts(cls) -> dict:
+        """
+        Return the number of breaches of every call.
+        """
+
+        with cls._lock:
+            return dict(cls._counts)
+
+    @classmethod
+    def export(cls) -> dict:
+        """
+        Export breach counts and samples for another process.
+        """
+
+        with cls._lock:
+            return {"counts": dict(cls._counts), "samples": list(cls._samples)}
+
+    @classmethod
+    def merge(cls, data: dict):
+        """
+        Add breaches exported by another process.
+        """
+
+        with cls._lock:
+            for call, count in data.get("counts", {}).items():
+                cls._counts[call] = cls._counts.get(call, 0) + count
+            free = max(cls.max_samples - len(cls._samples), 0)
+            cls._samples.extend(data.get("samples", [])[:free])
+
+    @classmethod
+    def reset(cls):
+        """
+        Drop all recorded breaches.
+        """
+
+        with cls._lock:
+            cls._counts.clear()
+            cls._samples.clear()
@@ -0,0 +1,470 @@
+"""
+This module runs load against the contacts app with the API helpers.
+
+A weighted mix of scenarios is run by a pool of threads for a fixed
+duration or number of scenarios, optionally at a target rate:
+
+    python -m src.load --duration 60 --rps 20 --workers 10
+    python -m src.load --count 1000 --mix create_contact=2,get_contact=1
+
+With `--local` the load goes to the local stand-in API.
+"""
+
+import argparse
+import json
+import logging as logger
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.helpers.contacts_helper import ContactsHelper
+from src.helpers.users_helper import UsersHelper
+from src.latency_stats import LatencyBudget, LatencyHistogram, LatencyStats
+from src.payload_factory import PayloadFactory
+from src.requests_utilities import RequestUtilities, SessionPool
+
+DEFAULT_MIX = {
+    "create_user": 1,
+    "login": 2,
+    "create_contact": 4,
+    "get_contact": 6,
+    "update_contact": 3,
+    "delete_contact": 3,
+}
+
+# Payload kinds generated by the scenarios, the others are not prefilled.
+SCENARIO_PAYLOADS = {
+    "create_user": "user",
+    "create_contact": "contact",
+    "get_contact": "contact",
+    "update_contact": "contact",
+    "delete_contact": "contact",
+}
+
+
+def parse_mix(mix: str) -> dict:
+    """
+    Parse a scenario mix like "create_contact=2,get_contact=1".
+    """
+
+    weights = {}
+    for item in mix.split(","):
+        name, _, weight = item.partition("=")
+        name = name.strip()
+        if name not in DEFAULT_MIX:
+            raise ValueError(
+                f"Unknown scenario {name!r}, "
+                f"expected one of: {', '.join(DEFAULT_MIX)}"
+            )
+        weights[name] = float(weight or 1)
+    return weights
+
+
+# pylint: disable=too-many-instance-attributes
+class LoadRunner:
+    """
+    Class that runs a weighted mix of API scenarios.
+
+    Scenarios run under one load account created for the run.
+    Contacts created by the load are kept in a pool, so get, update
+    and delete scenarios work on existing contacts.
+    """
+
+    def __init__(
+        self,
+        mix: dict | None = None,
+        workers: int | None = None,
+        rps: float = 0.0,
+        seed: int | None = None,
+    ):
+        self.mix = mix or DEFAULT_MIX
+        self.workers = workers or SessionPool.pool_size
+        self.rps = rps
+        SessionPool.configure(self.workers)
+
+        self.__random = random.Random(seed)
+        self.__lock = threading.Lock()
+        self.__contact_ids: list = []
+        self.__account: dict = {}
+
+        self.__scenarios = {
+            "create_user": self.__create_user,
+            "login": self.__login,
+            "create_contact": self.__create_contact,
+            "get_contact": self.__get_contact,
+            "update_contact": self.__update_contact,
+            "delete_contact": self.__delete_contact,
+        }
+
+        self.histograms = {name: LatencyHistogram() for name in self.mix}
+        self.errors = {name: 0 for name in self.mix}
+
+    def run(
+        self, duration: float | None = None, count: int | None = None
+    ) -> dict:
+        """
+        Run scenarios until the duration is over or `count` are run.
+        """
+
+        if duration is None and count is None:
+            raise ValueError("Set a duration or a count of scenarios.")
+
+        self.__create_account()
+        LatencyStats.reset()
+        LatencyBudget.reset()
+
+        names = list(self.mix)
+        weights = [self.mix[name] for name in names]
+        in_flight = threading.Semaphore(self.workers)
+
+        def run_one(name: str):
+            try:
+                self.__run_scenario(name)
+            finally:
+                in_flight.release()
+
+        logger.info(
+            "Start load: mix %s, %s workers, %s rps.",
+            self.mix,
+            self.workers,
+            self.rps or "max",
+        )
+
+        started = 0
+        start = time.perf_counter()
+        # The account is deleted on errors and Ctrl+C too, the executor
+        # lets the scenarios in flight finish first.
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                while True:
+                    elapsed = time.perf_counter() - start
+                    if count is not None and started >= count:
+                        break
+                    if duration is not None and elapsed >= duration:
+                        break
+
+                    if self.rps:
+                        delay = started / self.rps - elapsed
+                        if delay > 0:
+                            time.sleep(delay)
+
+                    in_flight.acquire()  # pylint: disable=consider-using-with
+                    name = self.__random.choices(names, weights)[0]
+                    executor.submit(run_one, name)
+                    started += 1
+
+            total_s = time.perf_counter() - start
+        finally:
+            self.__delete_account()
+
+        return self.report(started, total_s)
+
+    def report(self, scenarios: int, total_s: float) -> dict:
+        """
+        Build the report of throughput, errors and latencies.
+        """
+
+        errors = sum(self.errors.values())
+        return {
+            "scenarios": scenarios,
+            "errors": errors,
+            "error_rate": errors / scenarios if scenarios else 0.0,
+            "total_s": round(total_s, 3),
+            "throughput": round(scenarios / total_s, 2) if total_s else 0.0,
+            "by_scenario": {
+                name: {
+                    "count": histogram.count,
+                    "errors": self.errors[name],
+                    "p50": round(histogram.percentile(50), 1),
+                    "p95": round(histogram.percentile(95), 1),
+                    "p99": round(histogram.percentile(99), 1),
+                }
+                for name, histogram in self.histograms.items()
+            },
+            "by_endpoint": LatencyStats.summary(),
+            "breaches": LatencyBudget.counts(),
+            "payloads": PayloadFactory.stats(),
+        }
+
+    def __run_scenario(self, name: str):
+        """
+        Run one scenario and record its latency or error.
+        """
+
+        start = time.perf_counter()
+        try:
+            self.__scenarios[name]()
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.debug("Scenario %s failed: %s", name, e)
+            with self.__lock:
+                self.errors[name] += 1
+            return
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        with self.__lock:
+            self.histograms[name].add(elapsed_ms)
+
+    def __create_account(self):
+        """
+        Create the account the load runs under.
+        """
+
+        user_rs_api, user_info = UsersHelper().create_user(auth_headers={})
+        self.__account = {
+            "email": user_info["email"],
+            "password": user_info["password"],
+            "headers": {"Authorization": f"Bearer {user_rs_api['token']}"},
+        }
+        logger.info("Load account: %s", user_info["email"])
+
+    def __delete_account(self):
+        """
+        Delete the load account with all of its contacts.
+        """
+
+        UsersHelper().delete_user(auth_headers=self.__headers())
+        self.__contact_ids.clear()
+
+    def __headers(self) -> dict:
+        """
+        Return a copy of the load account headers for one call.
+        """
+
+        return dict(self.__account["headers"])
+
+    def __checkout_contact(self) -> str:
+        """
+        Take a random contact out of the pool, creating one if it is empty.
+
+        A checked out contact is used by one scenario at a time.
+        """
+
+        with self.__lock:
+            if self.__contact_ids:
+                index = self.__random.randrange(len(self.__contact_ids))
+                contact_id = self.__contact_ids[index]
+                # Move the last one into its place to remove it in O(1).
+                self.__contact_ids[index] = self.__contact_ids[-1]
+                self.__contact_ids.pop()
+                return contact_id
+
+        contact_rs_api, _ = ContactsHelper().create_contact(
+            auth_headers=self.__headers()
+        )
+        return contact_rs_api["_id"]
+
+    def __checkin_contact(self, contact_id: str):
+        """
+        Return a contact to the pool.
+        """
+
+        with self.__lock:
+            self.__contact_ids.append(contact_id)
+
+    def __create_user(self):
+        """
+        Register a new user and delete it.
+        """
+
+        user_rs_api, _ = UsersHelper().create_user(auth_headers={})
+        UsersHelper().delete_user(
+            auth_headers={"Authorization": f"Bearer {user_rs_api['token']}"}
+        )
+
+    def __login(self):
+        """
+        Login with the load account.
+        """
+
+        RequestUtilities().post(
+            endpoint="users/login",
+            payload={
+                "email": self.__account["email"],
+                "password": self.__account["password"],
+            },
+        )
+
+    def __create_contact(self):
+        """
+        Create a contact and add it to the pool.
+        """
+
+        contact_rs_api, _ = ContactsHelper().create_contact(
+            auth_headers=self.__headers()
+        )
+        self.__checkin_contact(contact_rs_api["_id"])
+
+    def __get_contact(self):
+        """
+        Get a contact from the pool.
+        """
+
+        contact_id = self.__checkout_contact()
+        try:
+            ContactsHelper().get_contacts(
+                auth_headers=self.__headers(), contact_id=contact_id
+            )
+        finally:
+            self.__checkin_contact(contact_id)
+
+    def __update_contact(self):
+        """
+        Update all fields of a contact from the pool.
+        """
+
+        contact_id = self.__checkout_contact()
+        try:
+            ContactsHelper().update(
+                auth_headers=self.__headers(),
+                payload=ContactsHelper.generate_contact_payload(),
+                contact_id=contact_id,
+            )
+        finally:
+            self.__checkin_contact(contact_id)
+
+    def __delete_contact(self):
+        """
+        Delete a contact from the pool.
+        """
+
+        ContactsHelper().delete_contact(
+            auth_headers=self.__headers(),
+            contact_id=self.__checkout_contact(),
+        )
+
+
+def print_report(report: dict):
+    """
+    Print the load report as tables.
+    """
+
+    print(
+        f"scenarios: {report['scenarios']}, errors: {report['errors']} "
+        f"({report['error_rate']:.2%}), time: {report['total_s']} s, "
+        f"throughput: {report['throughput']} scenarios/s"
+    )
+    for kind, stats in report["payloads"].items():
+        print(
+            f"{kind} payloads: generated {stats['generated']} "
+            f"({stats['per_s']:.0f}/s), "
+            f"buffer hits {stats['buffer_hit_rate']:.0%}"
+        )
+
+    print(
+        f"\n{'scenario':<16} {'count':>7} {'errors':>7} "
+        f"{'p50':>8} {'p95':>8} {'p99':>8}"
+    )
+    for name, row in report["by_scenario"].items():
+        print(
+            f"{name:<16} {row['count']:>7} {row['errors']:>7} "
+            f"{row['p50']:>8.1f} {row['p95']:>8.1f} {row['p99']:>8.1f}"
+        )
+
+    print(
+        f"\n{'method':<7} {'endpoint':<20} {'calls':>7} "
+        f"{'p50':>8} {'p95':>8} {'p99':>8}"
+    )
+    for row in report["by_endpoint"]:
+        print(
+            f"{row['method']:<7} {row['endpoint']:<20} {row['calls']:>7} "
+            f"{row['p50']:>8.1f} {row['p95']:>8.1f} {row['p99']:>8.1f}"
+        )
+
+    if report["breaches"]:
+        print(f"\nlatency budget breaches: {sum(report['breaches'].values())}")
+        for call, count in report["breaches"].items():
+            print(f"{call:<28} {count:>7}")
+
+
+def main(argv: list | None = None):
+    """
+    Run the load from the command line.
+    """
+
+    parser = argparse.ArgumentParser(
+        prog="python -m src.load", description=__doc__.split("\n\n")[1]
+    )
+    parser.add_argument("--duration", type=float, help="Run time in seconds")
+    parser.add_argument("--count", type=int, help="Number of scenarios to run")
+    parser.add_argument(
+        "--rps",
+        type=float,
+        default=0.0,
+        help="Target scenarios per second (default: as fast as possible)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=SessionPool.pool_size,
+        help="Number of threads",
+    )
+    parser.add_argument(
+        "--mix",
+        type=parse_mix,
+        default=DEFAULT_MIX,
+        help="Scenario weights, e.g. create_contact=2,get_contact=1 "
+        f"(scenarios: {', '.join(DEFAULT_MIX)})",
+    )
+    parser.add_argument(
+        "--seed", type=int, help="Seed of the scenario mix and payloads"
+    )
+    parser.add_argument(
+        "--local",
+        action="store_true",
+        help="Start the local stand-in API and load it",
+    )
+    parser.add_argument("--output", help="Write the report to a JSON file")
+    parser.add_argument(
+        "--verbose", action="store_true", help="Log every request"
+    )
+    args = parser.parse_args(argv)
+
+    if args.duration is None and args.count is None:
+        parser.error("set --duration or --count")
+
+    logger.basicConfig(
+        level=logger.INFO if args.verbose else logger.WARNING,
+        format="%(asctime)s - %(levelname)s - %(message)s",
+    )
+
+    local_api = None
+    if args.local:
+        # pylint: disable=import-outside-toplevel
+        from src.hosts_config import LOCAL_API_PORT
+        from src.local_api import start_local_api
+
+        os.environ["ENV"] = "local"
+        local_api = start_local_api(LOCAL_API_PORT)
+
+    # Payloads are pre-generated off the timed calls, and the seed
+    # also makes them reproducible.
+    PayloadFactory.configure(
+        seed=args.seed,
+        prefill=True,
+        kinds={
+            SCENARIO_PAYLOADS[name]
+            for name in args.mix
+            if name in SCENARIO_PAYLOADS
+        },
+    )
+
+    try:
+        runner = LoadRunner(
+            mix=args.mix, workers=args.workers, rps=args.rps, seed=args.seed
+        )
+        report = runner.run(duration=args.duration, count=args.count)
+    finally:
+        SessionPool.close()
+        if local_api is not None:
+            local_api.stop()
+
+    print_report(report)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,638 @@
+"""
+This module provides a local in-process stand-in for the contacts API.
+
+It implements the endpoints used by the API tests:
+
+- "users", "users/me", "users/login", "users/logout"
+- "contacts", "contacts/<id>"
+
+Validation rules and messages follow the remote app. All data is kept
+in memory, users are indexed by email and token, contacts by owner.
+
+Run it standalone with `python -m src.local_api`.
+"""
+
+import base64
+import json
+import logging as logger
+import os
+import re
+import secrets
+import threading
+import time
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+EMAIL_PATTERN = re.compile(r"^[^\s@]+@[^\s@]+\.[^\s@]+$")
+PHONE_PATTERN = re.compile(r"^\+?[\d\s().-]*\d[\d\s().-]*$")
+
+# (field, required, max length, validator, validator message)
+USER_SCHEMA = (
+    ("firstName", True, 20, None, None),
+    ("lastName", True, 20, None, None),
+    ("email", True, None, EMAIL_PATTERN.match, "Email is invalid"),
+    ("password", True, None, None, None),
+)
+USER_PASSWORD_MIN_LENGTH = 7
+
+CONTACT_SCHEMA = (
+    ("firstName", True, 20, None, None),
+    ("lastName", True, 20, None, None),
+    ("birthdate", False, None, "date", "Birthdate is invalid"),
+    ("email", False, None, EMAIL_PATTERN.match, "Email is invalid"),
+    ("phone", False, 15, PHONE_PATTERN.match, "Phone number is invalid"),
+    ("street1", False, 40, None, None),
+    ("street2", False, 40, None, None),
+    ("city", False, 40, None, None),
+    ("stateProvince", False, 20, None, None),
+    ("postalCode", False, 10, None, None),
+    ("country", False, 40, None, None),
+)
+CONTACT_FIELDS = tuple(field for field, *_ in CONTACT_SCHEMA)
+
+
+class LocalApiError(Exception):
+    """
+    An error response of the local API.
+    """
+
+    def __init__(self, status_code: int, body: dict | None = None):
+        super().__init__(status_code, body)
+        self.status_code = status_code
+        self.body = body
+
+
+def new_object_id() -> str:
+    """
+    Generate a 24 hex digit id like a MongoDB ObjectId.
+    """
+
+    return f"{int(time.time()):08x}{secrets.token_hex(8)}"
+
+
+def is_valid_date(value: str) -> bool:
+    """
+    Check that the value is a date in YYYY-MM-DD format.
+    """
+
+    try:
+        date.fromisoformat(value)
+    except ValueError:
+        return False
+    return bool(re.fullmatch(r"\d{4}-\d{2}-\d{2}", value))
+
+
+def validate(data: dict, schema: tuple, only_present: bool = False) -> dict:
+    """
+    Validate data against a schema like mongoose does.
+
+    Returns {field: error message}. Required and length errors come
+    first, then custom validator errors. Every field reports only
+    its first error.
+    """
+
+    builtin_errors = {}
+    custom_errors = {}
+
+    for field, required, max_length, validator, message in schema:
+        if only_present and field not in data:
+            continue
+
+        value = data.get(field)
+        value = "" if value is None else str(value)
+
+        if not value:
+            if required:
+                builtin_errors[field] = f"Path `{field}` is required."
+            continue
+
+        if max_length is not None and len(value) > max_length:
+            builtin_errors[field] = (
+                f"Path `{field}` (`{value}`) is longer than "
+                f"the maximum allowed length ({max_length})."
+            )
+            continue
+
+        if validator == "date":
+            if not is_valid_date(value):
+                custom_errors[field] = message
+        elif validator is not None and not validator(value):
+            custom_errors[field] = message
+
+    return builtin_errors | custom_errors
+
+
+def validation_error(errors: dict, prefix: str) -> LocalApiError:
+    """
+    Build a mongoose-like validation error response.
+    """
+
+    details = ", ".join(
+        f"{field}: {message}" for field, message in errors.items()
+    )
+    return LocalApiError(
+        400,
+        {
+            "errors": {
+                field: {"message": message, "path": field}
+                for field, message in errors.items()
+            },
+            "_message": prefix,
+            "name": "ValidationError",
+            "message": f"{prefix}: {details}",
+        },
+    )
+
+
+# pylint: disable=too-many-instance-attributes
+class LocalContactsStore:
+    """
+    In-memory storage of users, tokens and contacts.
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()
+
+        self.users: dict = {}
+        self.user_ids_by_email: dict = {}
+        self.user_ids_by_token: dict = {}
+        self.tokens_by_user_id: dict = {}
+
+        self.contacts: dict = {}
+        self.contact_ids_by_owner: dict = {}
+
+    @staticmethod
+    def public_user(user: dict) -> dict:
+        """
+        Return the user without the password.
+        """
+
+        return {key: value for key, value in user.items() if key != "password"}
+
+    def issue_token(self, user_id: str) -> str:
+        """
+        Create a JWT-shaped token for the user.
+        """
+
+        def encode(data: dict) -> str:
+            raw = json.dumps(data, separators=(",", ":")).encode()
+            return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+        token = ".".join(
+            (
+                encode({"alg": "HS256", "typ": "JWT"}),
+                encode({"_id": user_id, "iat": int(time.time())}),
+                secrets.token_urlsafe(32),
+            )
+        )
+        self.user_ids_by_token[token] = user_id
+        self.tokens_by_user_id.setdefault(user_id, set()).add(token)
+        return token
+
+    def authenticate(self, authorization: str | None) -> dict:
+        """
+        Return the user of the bearer token.
+        """
+
+        token = (authorization or "").removeprefix("Bearer ").strip()
+        user_id = self.user_ids_by_token.get(token)
+        if user_id is None:
+            raise LocalApiError(401, {"error": "Please authenticate."})
+        return self.users[user_id]
+
+    def create_user(self, payload: dict) -> dict:
+        """
+        Add a new user and log it in.
+        """
+
+        errors = validate(payload, USER_SCHEMA)
+        self.check_password(payload, errors)
+        if errors:
+            raise validation_error(errors, "User validation failed")
+
+        email = str(payload["email"]).lower()
+        if email in self.user_ids_by_email:
+            raise LocalApiError(
+                400, {"message": "Email address is already in use"}
+            )
+
+        user = {
+            "_id": new_object_id(),
+            "firstName": payload["firstName"],
+            "lastName": payload["lastName"],
+            "email": email,
+            "password": str(payload["password"]),
+            "__v": 1,
+        }
+        self.users[user["_id"]] = user
+        self.user_ids_by_email[email] = user["_id"]
+        self.contact_ids_by_owner[user["_id"]] = {}
+
+        token = self.issue_token(user["_id"])
+        return {"user": self.public_user(user), "token": token}
+
+    @staticmethod
+    def check_password(payload: dict, errors: dict):
+        """
+        Add the password length error like mongoose minlength.
+        """
+
+        password = str(payload.get("password") or "")
+        if password and len(password) < USER_PASSWORD_MIN_LENGTH:
+            errors["password"] = (
+                f"Path `password` (`{password}`) is shorter than "
+                f"the minimum allowed length ({USER_PASSWORD_MIN_LENGTH})."
+            )
+
+    def login(self, payload: dict) -> dict:
+        """
+        Log in the user by email and password.
+        """
+
+        email = str(payload.get("email") or "").lower()
+        user_id = self.user_ids_by_email.get(email)
+        if user_id is None or self.users[user_id]["password"] != str(
+            payload.get("password") or ""
+        ):
+            raise LocalApiError(401)
+
+        token = self.issue_token(user_id)
+        return {"user": self.public_user(self.users[user_id]), "token": token}
+
+    def logout(self, authorization: str | None):
+        """
+        Invalidate the bearer token.
+        """
+
+        user = self.authenticate(authorization)
+        token = (authorization or "").removeprefix("Bearer ").strip()
+        self.user_ids_by_token.pop(token, None)
+        self.tokens_by_user_id[user["_id"]].discard(token)
+
+    def update_user(self, user: dict, payload: dict) -> dict:
+        """
+        Update the user with the given fields.
+        """
+
+        updated = user | {
+            field: payload[field]
+            for field, *_ in USER_SCHEMA
+            if field in payload
+        }
+        errors = validate(updated, USER_SCHEMA)
+        self.check_password(updated, errors)
+        if errors:
+            raise validation_error(errors, "User validation failed")
+
+        email = str(updated["email"]).lower()
+        owner_id = self.user_ids_by_email.get(email)
+        if owner_id is not None and owner_id != user["_id"]:
+            raise LocalApiError(
+                400, {"message": "Email address is already in use"}
+            )
+
+        del self.user_ids_by_email[user["email"]]
+        updated["email"] = email
+        updated["password"] = str(updated["password"])
+        self.user_ids_by_email[email] = user["_id"]
+        self.users[user["_id"]] = updated
+        return self.public_user(updated)
+
+    def delete_user(self, user: dict):
+        """
+        Delete the user with its tokens and contacts.
+        """
+
+        for contact_id in self.contact_ids_by_owner.pop(user["_id"], {}):
+            self.contacts.pop(contact_id, None)
+        for token in self.tokens_by_user_id.pop(user["_id"], set()):
+            self.user_ids_by_token.pop(token, None)
+        del self.user_ids_by_email[user["email"]]
+        del self.users[user["_id"]]
+
+    def create_contact(self, user: dict, payload: dict) -> dict:
+        """
+        Add a new contact of the user.
+        """
+
+        errors = validate(payload, CONTACT_SCHEMA)
+        if errors:
+            raise validation_error(errors, "Contact validation failed")
+
+        contact = {"_id": new_object_id()}
+        contact |= {
+            field: str(payload[field])
+            for field in CONTACT_FIELDS
+            if payload.get(field) not in (None, "")
+        }
+        contact |= {"owner": user["_id"], "__v": 0}
+
+        self.contacts[contact["_id"]] = contact
+        self.contact_ids_by_owner[user["_id"]][contact["_id"]] = None
+        return contact
+
+    def get_contact(self, user: dict, contact_id: str) -> dict:
+        """
+        Return the contact of the user.
+        """
+
+        if contact_id not in self.contact_ids_by_owner[user["_id"]]:
+            raise LocalApiError(404)
+        return self.contacts[contact_id]
+
+    def list_contacts(self, user: dict) -> list:
+        """
+        Return all contacts of the user.
+        """
+
+        return [
+            self.contacts[contact_id]
+            for contact_id in self.contact_ids_by_owner[user["_id"]]
+        ]
+
+    def replace_contact(
+        self, user: dict, contact_id: str, payload: dict
+    ) -> dict:
+        """
+        Update the contact like findByIdAndUpdate with validators.
+        """
+
+        errors = validate(payload, CONTACT_SCHEMA, only_present=True)
+        if errors:
+            raise validation_error(errors, "Validation failed")
+
+        contact = self.get_contact(user, contact_id)
+        contact.update(
+            {
+                field: str(payload[field])
+                for field in CONTACT_FIELDS
+                if field in payload
+            }
+        )
+        return contact
+
+    def update_contact(
+        self, user: dict, contact_id: str, payload: dict
+    ) -> dict:
+        """
+        Update the contact like document save.
+        """
+
+        contact = self.get_contact(user, contact_id)
+        updated = contact | {
+            field: payload[field]
+            for field in CONTACT_FIELDS
+            if field in payload
+        }
+
+        errors = validate(updated, CONTACT_SCHEMA)
+        if errors:
+            raise validation_error(errors, "Contact validation failed")
+
+        contact.update(
+            {
+                field: str(payload[field])
+                for field in CONTACT_FIELDS
+                if field in payload
+            }
+        )
+        return contact
+
+    def delete_contact(self, user: dict, contact_id: str):
+        """
+        Delete the contact of the user.
+        """
+
+        self.get_contact(user, contact_id)
+        del self.contact_ids_by_owner[user["_id"]][contact_id]
+        del self.contacts[contact_id]
+
+
+class LocalApiHandler(BaseHTTPRequestHandler):
+    """
+    HTTP handler that routes requests to the local storage.
+    """
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately, Nagle would delay the body.
+    disable_nagle_algorithm = True
+    store: LocalContactsStore
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """
+        Handle GET requests.
+        """
+
+        self.handle_api("GET")
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        """
+        Handle POST requests.
+        """
+
+        self.handle_api("POST")
+
+    def do_PUT(self):  # pylint: disable=invalid-name
+        """
+        Handle PUT requests.
+        """
+
+        self.handle_api("PUT")
+
+    def do_PATCH(self):  # pylint: disable=invalid-name
+        """
+        Handle PATCH requests.
+        """
+
+        self.handle_api("PATCH")
+
+    def do_DELETE(self):  # pylint: disable=invalid-name
+        """
+        Handle DELETE requests.
+        """
+
+        self.handle_api("DELETE")
+
+    def handle_api(self, method: str):
+        """
+        Run the endpoint and send its response.
+        """
+
+        try:
+            payload = self.read_payload()
+            path = urlsplit(self.path).path.strip("/")
+            with self.store.lock:
+                status_code, body = self.route(method, path, payload)
+        except LocalApiError as e:
+            status_code, body = e.status_code, e.body
+
+        self.send_json(status_code, body)
+
+    def read_payload(self) -> dict:
+        """
+        Read the JSON body of the request.
+        """
+
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+
+        try:
+            payload = json.loads(self.rfile.read(length))
+        except ValueError as e:
+            raise LocalApiError(400, {"message": "Invalid JSON"}) from e
+        return payload if isinstance(payload, dict) else {}
+
+    # pylint: disable=too-many-return-statements,too-many-branches
+    def route(self, method: str, path: str, payload: dict):
+        """
+        Call the storage method for the endpoint.
+        """
+
+        store = self.store
+        authorization = self.headers.get("Authorization")
+
+        if (method, path) == ("POST", "users"):
+            return 201, store.create_user(payload)
+        if (method, path) == ("POST", "users/login"):
+            return 200, store.login(payload)
+        if (method, path) == ("POST", "users/logout"):
+            store.logout(authorization)
+            return 200, None
+
+        user = store.authenticate(authorization)
+
+        if path == "users/me":
+            if method == "GET":
+                return 200, store.public_user(user)
+            if method == "PATCH":
+                return 200, store.update_user(user, payload)
+            if method == "DELETE":
+                store.delete_user(user)
+                return 200, None
+
+        if path == "contacts":
+            if method == "GET":
+                return 200, store.list_contacts(user)
+            if method == "POST":
+                return 201, store.create_contact(user, payload)
+
+        if path.startswith("contacts/"):
+            contact_id = path.removeprefix("contacts/")
+            if method == "GET":
+                return 200, store.get_contact(user, contact_id)
+            if method == "PUT":
+                return 200, store.replace_contact(user, contact_id, payload)
+            if method == "PATCH":
+                return 200, store.update_contact(user, contact_id, payload)
+            if method == "DELETE":
+                store.delete_contact(user, contact_id)
+                return 200, None
+
+        raise LocalApiError(404)
+
+    def send_json(self, status_code: int, body):
+        """
+        Send a JSON response, or an empty one for None.
+        """
+
+        data = b"" if body is None else json.dumps(body).encode()
+
+        self.send_response(status_code)
+        if data:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        """
+        Log requests with the project logger.
+        """
+
+        logger.debug("Local API: " + format, *args)
+
+
+class LocalApiServer:
+    """
+    The local API served from a background thread.
+    """
+
+    def __init__(self, port: int, host: str = "127.0.0.1"):
+        self.store = LocalContactsStore()
+
+        handler = type(
+            "BoundLocalApiHandler", (LocalApiHandler,), {"store": self.store}
+        )
+        self.server = ThreadingHTTPServer((host, port), handler)
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(
+            target=self.server.serve_forever, daemon=True
+        )
+
+    def add_user(self, email: str, password: str) -> dict:
+        """
+        Register a user before the tests, e.g. the account from `.env`.
+        """
+
+        with self.store.lock:
+            return self.store.create_user(
+                {
+                    "firstName": "Local",
+                    "lastName": "User",
+                    "email": email,
+                    "password": password,
+                }
+            )
+
+    def start(self):
+        """
+        Start serving requests.
+        """
+
+        logger.info(
+            "Start local API on port %s.", self.server.server_address[1]
+        )
+        self.thread.start()
+
+    def stop(self):
+        """
+        Stop serving requests.
+        """
+
+        logger.info("Stop local API.")
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def start_local_api(port: int) -> LocalApiServer:
+    """
+    Start the local API with the account from `.env`.
+    """
+
+    server = LocalApiServer(port=port)
+
+    my_email = os.getenv("MY_EMAIL")
+    my_pass = os.getenv("MY_PASSWORD")
+    if my_email and my_pass:
+        server.add_user(email=my_email, password=my_pass)
+
+    server.start()
+    return server
+
+
+if __name__ == "__main__":
+    # pylint: disable=ungrouped-imports
+    from src.hosts_config import LOCAL_API_PORT
+
+    logger.basicConfig(level=logger.INFO)
+    local_api = start_local_api(LOCAL_API_PORT)
+    try:
+        local_api.thread.join()
+    except KeyboardInterrupt:
+        local_api.stop()
@@ -24,6 +24,7 @@ class LoginPageLocators:
     """
 
     LOGIN_PAGE_URL: str = base_url + "login"
+    TOKEN_COOKIE: str = "token"
     LOGIN_FORM = (By.TAG_NAME, "form")
     SIGN_UP_BUTTON = (By.CSS_SELECTOR, "#signup")
     REGISTER_EMAIL = (By.CSS_SELECTOR, "#email")
@@ -92,6 +93,7 @@ class ContactDetailsPageLocators:
     """
 
     CONTACT_DETAILS_PAGE_URL: str = base_url + "contactDetails"
+    CONTACT_ID_STORAGE_KEY: str = "contactId"
     CONTACT_DETAILS_FORM = (By.CSS_SELECTOR, "#contactDetails")
     LOGOUT_BUTTON = (By.CSS_SELECTOR, "#logout")
     RETURN_BUTTON = (By.CSS_SELECTOR, "#return")
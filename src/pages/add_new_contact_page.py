@@ -94,9 +94,14 @@ class AddNewContactPage(BasePage):
         state,
         postal_code,
         country,
+        *,
+        type_keys: bool = False,
     ):
         """
         Method to add new contact.
+
+        Fields are filled with one script call,
+        `type_keys` types them with send_keys instead.
         """
 
         logger.info(
@@ -105,53 +110,21 @@ class AddNewContactPage(BasePage):
             last_name,
         )
 
-        first_name_form = self.browser.find_element(
-            *AddNewContactPageLocators.FIRST_NAME
-        )
-        first_name_form.send_keys(first_name)
-
-        last_name_form = self.browser.find_element(
-            *AddNewContactPageLocators.LAST_NAME
-        )
-        last_name_form.send_keys(last_name)
-
-        date_of_birth_form = self.browser.find_element(
-            *AddNewContactPageLocators.DATE_OF_BIRTH
-        )
-        date_of_birth_form.send_keys(date_of_birth)
-
-        email_form = self.browser.find_element(
-            *AddNewContactPageLocators.EMAIL
-        )
-        email_form.send_keys(email)
-
-        phone_form = self.browser.find_element(
-            *AddNewContactPageLocators.PHONE
-        )
-        phone_form.send_keys(str(phone))
-
-        street_address_1_form = self.browser.find_element(
-            *AddNewContactPageLocators.STREET_ADDRESS_1
-        )
-        street_address_1_form.send_keys(street_address_1)
-
-        city_form = self.browser.find_element(*AddNewContactPageLocators.CITY)
-        city_form.send_keys(city)
-
-        state_form = self.browser.find_element(
-            *AddNewContactPageLocators.STATE
-        )
-        state_form.send_keys(state)
-
-        postal_code_form = self.browser.find_element(
-            *AddNewContactPageLocators.POSTAL_CODE
-        )
-        postal_code_form.send_keys(str(postal_code))
-
-        country_form = self.browser.find_element(
-            *AddNewContactPageLocators.COUNTRY
+        self.fill_form(
+            {
+                AddNewContactPageLocators.FIRST_NAME: first_name,
+                AddNewContactPageLocators.LAST_NAME: last_name,
+                AddNewContactPageLocators.DATE_OF_BIRTH: date_of_birth,
+                AddNewContactPageLocators.EMAIL: email,
+                AddNewContactPageLocators.PHONE: phone,
+                AddNewContactPageLocators.STREET_ADDRESS_1: street_address_1,
+                AddNewContactPageLocators.CITY: city,
+                AddNewContactPageLocators.STATE: state,
+                AddNewContactPageLocators.POSTAL_CODE: postal_code,
+                AddNewContactPageLocators.COUNTRY: country,
+            },
+            type_keys=type_keys,
         )
-        country_form.send_keys(country)
 
         submit_button = self.browser.find_element(
             *AddNewContactPageLocators.SUBMIT_BUTTON
@@ -5,8 +5,84 @@ This module provides methods for interacting with the "Base" page.
 from selenium import webdriver
 from selenium.common import NoSuchElementException
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
 
+# Finds an element in the page for a Selenium (by, value) locator.
+FIND_ELEMENT_JS = """
+function findElement(how, what) {
+    switch (how) {
+        case "css selector":
+            return document.querySelector(what);
+        case "xpath":
+            return document.evaluate(
+                what, document, null,
+                XPathResult.FIRST_ORDERED_NODE_TYPE, null
+            ).singleNodeValue;
+        case "id":
+            return document.getElementById(what);
+        case "name":
+            return document.getElementsByName(what)[0] || null;
+        case "tag name":
+            return document.getElementsByTagName(what)[0] || null;
+        case "class name":
+            return document.getElementsByClassName(what)[0] || null;
+    }
+    return null;
+}
+"""
+
+GET_VALUES_JS = (
+    FIND_ELEMENT_JS
+    + """
+const result = {};
+for (const [name, [how, what]] of Object.entries(arguments[0])) {
+    const element = findElement(how, what);
+    if (element === null) {
+        result[name] = null;
+    } else if (["INPUT", "TEXTAREA", "SELECT"].includes(element.tagName)) {
+        result[name] = element.value;
+    } else {
+        result[name] = element.innerText.trim();
+    }
+}
+return result;
+"""
+)
+
+FILL_FORM_JS = (
+    FIND_ELEMENT_JS
+    + """
+const missing = [];
+for (const [how, what, value] of arguments[0]) {
+    const element = findElement(how, what);
+    if (element === null) {
+        missing.push(what);
+        continue;
+    }
+    // The native setter keeps frameworks that track the value in sync.
+    const setter = Object.getOwnPropertyDescriptor(
+        Object.getPrototypeOf(element), "value"
+    ).set;
+    element.focus();
+    setter.call(element, value);
+    element.dispatchEvent(new Event("input", {bubbles: true}));
+    element.dispatchEvent(new Event("change", {bubbles: true}));
+    element.blur();
+}
+return missing;
+"""
+)
+
+SCRIPT_LOCATOR_STRATEGIES = (
+    By.CSS_SELECTOR,
+    By.XPATH,
+    By.ID,
+    By.NAME,
+    By.TAG_NAME,
+    By.CLASS_NAME,
+)
+
 
 class BasePage:
     """
@@ -45,6 +121,50 @@ class BasePage:
             .text
         )
 
+    def get_values(self, locators: dict) -> dict:
+        """
+        Retrieve the text or value of several elements
+        with a single script call.
+
+        Returns None for elements that are not found.
+        """
+
+        for how, _ in locators.values():
+            if how not in SCRIPT_LOCATOR_STRATEGIES:
+                raise ValueError(f"Locator strategy {how} is not supported.")
+
+        return self.browser.execute_script(
+            GET_VALUES_JS,
+            {name: list(locator) for name, locator in locators.items()},
+        )
+
+    def fill_form(self, fields: dict, type_keys: bool = False):
+        """
+        Fill form fields given as {locator: value}.
+
+        All values are set with a single script call that fires
+        input and change events. With `type_keys` every field
+        is typed with send_keys instead.
+        """
+
+        if type_keys:
+            for locator, value in fields.items():
+                self.browser.find_element(*locator).send_keys(str(value))
+            return
+
+        for how, _ in fields:
+            if how not in SCRIPT_LOCATOR_STRATEGIES:
+                raise ValueError(f"Locator strategy {how} is not supported.")
+
+        missing = self.browser.execute_script(
+            FILL_FORM_JS,
+            [[how, what, str(value)] for (how, what), value in fields.items()],
+        )
+        if missing:
+            raise NoSuchElementException(
+                f"Form fields are not found: {', '.join(missing)}"
+            )
+
     def open(self):
         """
         Open the web page using the specified URL.
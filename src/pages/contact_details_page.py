@@ -6,6 +6,9 @@ import logging as logger
 import time
 from typing import Literal
 
+from selenium import webdriver
+from selenium.webdriver.support.wait import WebDriverWait
+
 from src.locators import ContactDetailsPageLocators
 from src.pages.base_page import BasePage
 
@@ -16,6 +19,29 @@ class ContactDetailsPage(BasePage):
     with the 'Contact Details' page.
     """
 
+    FIELD_LOCATORS = {
+        "first_name": ContactDetailsPageLocators.FIRST_NAME,
+        "last_name": ContactDetailsPageLocators.LAST_NAME,
+        "date_of_birth": ContactDetailsPageLocators.DATE_OF_BIRTH,
+        "email": ContactDetailsPageLocators.EMAIL,
+        "phone": ContactDetailsPageLocators.PHONE,
+        "street_address_1": ContactDetailsPageLocators.STREET_ADDRESS_1,
+        "street_address_2": ContactDetailsPageLocators.STREET_ADDRESS_2,
+        "city": ContactDetailsPageLocators.CITY,
+        "state": ContactDetailsPageLocators.STATE,
+        "postal_code": ContactDetailsPageLocators.POSTAL_CODE,
+        "country": ContactDetailsPageLocators.COUNTRY,
+    }
+
+    def __init__(
+        self,
+        browser: webdriver.Firefox | webdriver.Chrome,
+        url: str,
+        timeout: int = 5,
+    ):
+        super().__init__(browser=browser, url=url, timeout=timeout)
+        self.__info_loaded = False
+
     def should_be_contact_details_page(self):
         """
         Verify that the current page is the 'Contact Details' page.
@@ -48,6 +74,23 @@ class ContactDetailsPage(BasePage):
             *ContactDetailsPageLocators.CONTACT_DETAILS_FORM
         ), "Contact details form is not present."
 
+    def open_contact(self, contact_id: str):
+        """
+        Open the 'Contact Details' page for the contact with the given id.
+
+        The browser must already be on a page of the app.
+        """
+
+        logger.info("Open contact details for id=%s.", contact_id)
+        self.__info_loaded = False
+
+        self.browser.execute_script(
+            "window.localStorage.setItem(arguments[0], arguments[1]);",
+            ContactDetailsPageLocators.CONTACT_ID_STORAGE_KEY,
+            contact_id,
+        )
+        self.browser.get(ContactDetailsPageLocators.CONTACT_DETAILS_PAGE_URL)
+
     def logout(self):
         """
         Log out the current user from the 'Contact Details' page.
@@ -100,6 +143,26 @@ class ContactDetailsPage(BasePage):
         )
         edit_contact_button.click()
 
+    def wait_for_contact_info(self, timeout: int = 10):
+        """
+        Wait until the contact details are loaded from the API.
+        """
+
+        if self.__info_loaded:
+            return
+
+        start = time.perf_counter()
+        WebDriverWait(self.browser, timeout).until(
+            lambda driver: driver.find_element(
+                *ContactDetailsPageLocators.FIRST_NAME
+            ).text.strip()
+        )
+        self.__info_loaded = True
+
+        logger.info(
+            "Contact details loaded in %.3f s.", time.perf_counter() - start
+        )
+
     def get_info(
         self,
         what: Literal[
@@ -123,21 +186,19 @@ class ContactDetailsPage(BasePage):
 
         logger.info("Get info from field.")
 
-        locators_dict = {
-            "first_name": ContactDetailsPageLocators.FIRST_NAME,
-            "last_name": ContactDetailsPageLocators.LAST_NAME,
-            "date_of_birth": ContactDetailsPageLocators.DATE_OF_BIRTH,
-            "email": ContactDetailsPageLocators.EMAIL,
-            "phone": ContactDetailsPageLocators.PHONE,
-            "street_address_1": ContactDetailsPageLocators.STREET_ADDRESS_1,
-            "street_address_2": ContactDetailsPageLocators.STREET_ADDRESS_2,
-            "city": ContactDetailsPageLocators.CITY,
-            "state": ContactDetailsPageLocators.STATE,
-            "postal_code": ContactDetailsPageLocators.POSTAL_CODE,
-            "country": ContactDetailsPageLocators.COUNTRY,
-        }
-
-        time.sleep(3)
-        field_text = self.get_visible_element(*locators_dict[what])
+        self.wait_for_contact_info()
+        field_text = self.get_visible_element(*self.FIELD_LOCATORS[what])
 
         return field_text
+
+    def get_all_info(self) -> dict:
+        """
+        Retrieve information from all fields
+        on the 'Contact Details' page.
+        """
+
+        logger.info("Get info from all fields.")
+
+        self.wait_for_contact_info()
+
+        return self.get_values(self.FIELD_LOCATORS)
@@ -3,7 +3,6 @@ This module provides methods for interacting with the "Edit Contact" page.
 """
 
 import logging as logger
-import time
 from typing import Literal
 
 from selenium.webdriver.common.keys import Keys
@@ -19,6 +18,20 @@ class EditContactPage(BasePage):
     and interacting with the 'Edit Contact' page.
     """
 
+    FIELD_LOCATORS = {
+        "first_name": EditContactPageLocators.FIRST_NAME,
+        "last_name": EditContactPageLocators.LAST_NAME,
+        "date_of_birth": EditContactPageLocators.DATE_OF_BIRTH,
+        "email": EditContactPageLocators.EMAIL,
+        "phone": EditContactPageLocators.PHONE,
+        "street_address_1": EditContactPageLocators.STREET_ADDRESS_1,
+        "street_address_2": EditContactPageLocators.STREET_ADDRESS_2,
+        "city": EditContactPageLocators.CITY,
+        "state": EditContactPageLocators.STATE,
+        "postal_code": EditContactPageLocators.POSTAL_CODE,
+        "country": EditContactPageLocators.COUNTRY,
+    }
+
     def should_be_edit_contact_page(self):
         """
         Verify that the current page is the 'Edit Contact' page.
@@ -75,6 +88,17 @@ class EditContactPage(BasePage):
         )
         cancel_button.click()
 
+    def wait_for_contact_info(self, timeout: int = 10):
+        """
+        Wait until the edit form is filled with the contact from the API.
+        """
+
+        WebDriverWait(self.browser, timeout).until(
+            lambda driver: driver.find_element(
+                *EditContactPageLocators.FIRST_NAME
+            ).get_attribute("value")
+        )
+
     def edit_contact(
         self,
         what: Literal[
@@ -98,30 +122,41 @@ class EditContactPage(BasePage):
 
         logger.info("Edit %s contact with %s.", what, data)
 
-        locators_dict = {
-            "first_name": EditContactPageLocators.FIRST_NAME,
-            "last_name": EditContactPageLocators.LAST_NAME,
-            "date_of_birth": EditContactPageLocators.DATE_OF_BIRTH,
-            "email": EditContactPageLocators.EMAIL,
-            "phone": EditContactPageLocators.PHONE,
-            "street_address_1": EditContactPageLocators.STREET_ADDRESS_1,
-            "street_address_2": EditContactPageLocators.STREET_ADDRESS_2,
-            "city": EditContactPageLocators.CITY,
-            "state": EditContactPageLocators.STATE,
-            "postal_code": EditContactPageLocators.POSTAL_CODE,
-            "country": EditContactPageLocators.COUNTRY,
-        }
-
-        edit_field = self.browser.find_element(*locators_dict[what])
-
-        time.sleep(1)
-        edit_field.send_keys(Keys.CONTROL + "a")
-        edit_field.send_keys(Keys.DELETE)
-        WebDriverWait(self.browser, 2).until(
-            lambda driver: edit_field.get_attribute("value") == ""
-        )
+        self.edit_fields({what: data}, type_keys=True)
+
+    def edit_fields(self, fields: dict, type_keys: bool = False):
+        """
+        Edit several fields of the contact and submit the form once.
+
+        Fields are given as {field name: new value}, the names are
+        the same as in `edit_contact`. With `type_keys` every field
+        is cleared and typed with the keyboard.
+        """
 
-        edit_field.send_keys(data)
+        logger.info("Edit contact fields %s.", ", ".join(fields))
+
+        self.wait_for_contact_info()
+
+        if type_keys:
+            for what, data in fields.items():
+                edit_field = self.browser.find_element(
+                    *self.FIELD_LOCATORS[what]
+                )
+                edit_field.send_keys(Keys.CONTROL + "a")
+                edit_field.send_keys(Keys.DELETE)
+                WebDriverWait(self.browser, 2).until(
+                    lambda _, field=edit_field: not field.get_attribute(
+                        "value"
+                    )
+                )
+                edit_field.send_keys(data)
+        else:
+            self.fill_form(
+                {
+                    self.FIELD_LOCATORS[what]: data
+                    for what, data in fields.items()
+                }
+            )
 
         submit_button = self.browser.find_element(
             *EditContactPageLocators.SUBMIT_BUTTON
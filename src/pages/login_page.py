@@ -81,3 +81,19 @@ class LoginPage(BasePage):
             *LoginPageLocators.LOGIN_BUTTON
         )
         login_button.click()
+
+    def login_with_token(self, token: str):
+        """
+        Log in by setting the API token as the app auth cookie.
+
+        The browser must already be on a page of the app.
+        """
+
+        logger.info("Login with API token cookie")
+        self.browser.add_cookie(
+            {
+                "name": LoginPageLocators.TOKEN_COOKIE,
+                "value": token,
+                "path": "/",
+            }
+        )
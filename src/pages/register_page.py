@@ -2,6 +2,8 @@
 This module provides methods for interacting with the "Register" page.
 """
 
+# pylint: disable=too-many-arguments
+
 import logging as logger
 
 from src.locators import RegisterPageLocators
@@ -43,33 +45,32 @@ class RegisterPage(BasePage):
         ), "Register form is not presented."
 
     def register_new_user(
-        self, first_name: str, last_name: str, email: str, password: str
+        self,
+        first_name: str,
+        last_name: str,
+        email: str,
+        password: str,
+        *,
+        type_keys: bool = False,
     ):
         """
         Register a new user with the provided credentials.
+
+        Fields are filled with one script call,
+        `type_keys` types them with send_keys instead.
         """
 
         logger.info("Starting register new user.")
 
-        first_name_form = self.browser.find_element(
-            *RegisterPageLocators.REGISTER_FIRST_NAME
-        )
-        first_name_form.send_keys(first_name)
-
-        last_name_form = self.browser.find_element(
-            *RegisterPageLocators.REGISTER_LAST_NAME
-        )
-        last_name_form.send_keys(last_name)
-
-        email_form = self.browser.find_element(
-            *RegisterPageLocators.REGISTER_EMAIL
-        )
-        email_form.send_keys(email)
-
-        password_form = self.browser.find_element(
-            *RegisterPageLocators.REGISTER_PASSWORD
+        self.fill_form(
+            {
+                RegisterPageLocators.REGISTER_FIRST_NAME: first_name,
+                RegisterPageLocators.REGISTER_LAST_NAME: last_name,
+                RegisterPageLocators.REGISTER_EMAIL: email,
+                RegisterPageLocators.REGISTER_PASSWORD: password,
+            },
+            type_keys=type_keys,
         )
-        password_form.send_keys(password)
 
         register_button = self.browser.find_element(
             *RegisterPageLocators.REGISTER_BUTTON
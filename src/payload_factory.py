@@ -0,0 +1,273 @@
+"""
+This module provides a shared source of fake contact and user payloads.
+"""
+
+import logging as logger
+import os
+import threading
+import time
+import uuid
+import zlib
+from collections import deque
+
+from faker import Faker
+
+PAYLOAD_KINDS = ("contact", "user")
+
+# Added to emails of seeded users, an email can be registered only once.
+RUN_ID = uuid.uuid4().hex[:8]
+
+
+def derive_seed(seed: int, key: str) -> int:
+    """
+    Derive a stable seed for the key, e.g. a pytest node id.
+    """
+
+    return zlib.crc32(f"{seed}:{key}".encode())
+
+
+class PayloadFactory:
+    """
+    A process-wide factory of fake payloads from shared seeded Fakers.
+
+    Payloads are generated on demand. With `prefill` (load and soak runs)
+    they are pre-generated in batches by a background thread and served
+    from ring buffers instead. A buffer is refilled only after its own
+    kind drained it, so kinds that are not used are never pre-generated.
+    Every payload kind has its own Faker, and
+    generation and buffering share one lock, so payloads of a kind are
+    served in the order its Faker produced them.
+    """
+
+    _lock = threading.Lock()
+    _refill = threading.Event()
+    _thread: threading.Thread | None = None
+    _fakers: dict = {}
+    # Kinds whose buffers are below half and wait for the filler.
+    _pending: set = set()
+
+    seed: int | None = None
+    prefill: bool = os.getenv("PAYLOAD_PREFILL", "0") == "1"
+    prefill_kinds: tuple = PAYLOAD_KINDS
+    buffer_size: int = int(os.getenv("PAYLOAD_BUFFER_SIZE", "64"))
+    batch_size: int = 32
+
+    _buffers: dict = {
+        "contact": deque(maxlen=buffer_size),
+        "user": deque(maxlen=buffer_size),
+    }
+    _stats: dict = {
+        kind: {"generated": 0, "served": 0, "misses": 0, "time_s": 0.0}
+        for kind in PAYLOAD_KINDS
+    }
+
+    @classmethod
+    def configure(
+        cls,
+        seed: int | None = None,
+        buffer_size: int | None = None,
+        prefill: bool | None = None,
+        kinds: tuple | None = None,
+    ):
+        """
+        Reseed the factory and drop pre-generated payloads.
+
+        With `kinds` only payloads of these kinds are pre-generated.
+        """
+
+        with cls._lock:
+            cls.seed = seed
+            if buffer_size is not None:
+                cls.buffer_size = buffer_size
+            if prefill is not None:
+                cls.prefill = prefill
+            if kinds is not None:
+                cls.prefill_kinds = tuple(kinds)
+            cls._fakers.clear()
+            cls._pending.clear()
+            for kind in PAYLOAD_KINDS:
+                cls._buffers[kind] = deque(maxlen=cls.buffer_size)
+
+    @classmethod
+    def contact(cls) -> dict:
+        """
+        Return a fake contact payload with all 11 fields.
+        """
+
+        return cls.__take("contact")
+
+    @classmethod
+    def user(cls) -> dict:
+        """
+        Return a fake user payload.
+
+        With a seed the email gets the suffix of the run, so the same
+        user can be registered again in the next run.
+        """
+
+        payload = cls.__take("user")
+        if cls.seed is not None:
+            name, _, domain = payload["email"].partition("@")
+            payload["email"] = f"{name}.{RUN_ID}@{domain}"
+        return payload
+
+    @classmethod
+    def reseed(cls, seed: int):
+        """
+        Reseed the Fakers, keeping the buffers and the settings.
+
+        Used per test, when pre-generation is off and buffers are empty.
+        """
+
+        with cls._lock:
+            cls.seed = seed
+            for kind, fake in cls._fakers.items():
+                fake.seed_instance(f"{seed}:{kind}")
+
+    @classmethod
+    def stats(cls) -> dict:
+        """
+        Return generated and served payloads and generation throughput.
+        """
+
+        with cls._lock:
+            return {
+                kind: {
+                    "generated": stats["generated"],
+                    "served": stats["served"],
+                    "buffer_hit_rate": (
+                        1 - stats["misses"] / stats["served"]
+                        if stats["served"]
+                        else 0.0
+                    ),
+                    "per_s": (
+                        stats["generated"] / stats["time_s"]
+                        if stats["time_s"]
+                        else 0.0
+                    ),
+                }
+                for kind, stats in cls._stats.items()
+            }
+
+    @classmethod
+    def __take(cls, kind: str) -> dict:
+        """
+        Serve a payload from the buffer, generating it if it is empty.
+        """
+
+        with cls._lock:
+            buffer = cls._buffers[kind]
+            stats = cls._stats[kind]
+            stats["served"] += 1
+
+            if buffer:
+                payload = buffer.popleft()
+            else:
+                stats["misses"] += 1
+                payload = cls.__generate(kind)
+
+            if (
+                cls.prefill
+                and kind in cls.prefill_kinds
+                and len(buffer) < cls.buffer_size // 2
+            ):
+                cls._pending.add(kind)
+                cls.__start_filler()
+                cls._refill.set()
+
+        return payload
+
+    @classmethod
+    def __generate(cls, kind: str) -> dict:
+        """
+        Generate one payload, the lock must be held.
+        """
+
+        fake = cls._fakers.get(kind)
+        if fake is None:
+            fake = cls._fakers[kind] = Faker()
+            if cls.seed is not None:
+                fake.seed_instance(f"{cls.seed}:{kind}")
+
+        start = time.perf_counter()
+        if kind == "contact":
+            payload = cls.__generate_contact(fake)
+        else:
+            payload = cls.__generate_user(fake)
+
+        stats = cls._stats[kind]
+        stats["generated"] += 1
+        stats["time_s"] += time.perf_counter() - start
+        return payload
+
+    @staticmethod
+    def __generate_contact(fake: Faker) -> dict:
+        """
+        Generate fake contact data.
+        """
+
+        return {
+            "firstName": fake.first_name(),
+            "lastName": fake.last_name(),
+            "birthdate": (
+                fake.date_of_birth(minimum_age=6, maximum_age=110)
+            ).strftime("%Y-%m-%d"),
+            "email": fake.email(),
+            "phone": fake.basic_phone_number(),
+            "street1": fake.street_name(),
+            "street2": fake.street_name(),
+            "city": fake.city(),
+            "stateProvince": fake.state(),
+            "postalCode": fake.postalcode(),
+            # The app rejects a country longer than 40 characters.
+            "country": fake.country()[:40],
+        }
+
+    @staticmethod
+    def __generate_user(fake: Faker) -> dict:
+        """
+        Generate fake user data.
+        """
+
+        return {
+            "firstName": fake.first_name(),
+            "lastName": fake.last_name(),
+            "email": fake.email(),
+            "password": fake.password(length=8, special_chars=False),
+        }
+
+    @classmethod
+    def __start_filler(cls):
+        """
+        Start the background thread that refills the buffers.
+        """
+
+        if cls._thread is None:
+            logger.info("Start payload pre-generation.")
+            cls._thread = threading.Thread(target=cls.__fill, daemon=True)
+            cls._thread.start()
+
+    @classmethod
+    def __fill(cls):
+        """
+        Refill the buffers of pending kinds in batches.
+        """
+
+        while True:
+            cls._refill.wait()
+            cls._refill.clear()
+
+            with cls._lock:
+                kinds, cls._pending = cls._pending, set()
+
+            for kind in kinds:
+                while True:
+                    # The lock is released between batches,
+                    # so consumers wait for one batch at most.
+                    with cls._lock:
+                        buffer = cls._buffers[kind]
+                        free = cls.buffer_size - len(buffer)
+                        if not cls.prefill or free <= 0:
+                            break
+                        for _ in range(min(free, cls.batch_size)):
+                            buffer.append(cls.__generate(kind))
@@ -0,0 +1,183 @@
+"""
+This module provides the middleware chain of RequestUtilities.
+
+A middleware takes the call and the next handler of the chain and
+returns the response:
+
+    def middleware(call: dict, send: Callable) -> requests.Response
+
+The call has "method", "url", "endpoint", "headers", "json", "timeout",
+"expected_status_code" and "session". Only enabled middleware is
+chained, so a disabled concern costs nothing per call.
+"""
+
+import logging as logger
+import time
+from collections.abc import Callable
+from functools import partial
+
+import requests
+
+from src.api_recorder import ApiRecorder
+from src.latency_stats import LatencyStats
+
+# Methods that are safe to send again after a failure.
+IDEMPOTENT_METHODS = ("GET", "PUT", "DELETE")
+RETRY_STATUS_CODES = (502, 503, 504)
+
+
+def session_transport(call: dict) -> requests.Response:
+    """
+    Send the call through the HTTP session.
+    """
+
+    return call["session"].request(
+        call["method"],
+        url=call["url"],
+        headers=call["headers"],
+        json=call["json"],
+        timeout=call["timeout"],
+    )
+
+
+def replay_transport(call: dict) -> requests.Response:
+    """
+    Serve the call from the API record log.
+    """
+
+    return ApiRecorder.replay(
+        call["method"], call["endpoint"], call["url"], call["json"]
+    )
+
+
+def logging_middleware(call: dict, send: Callable) -> requests.Response:
+    """
+    Log the method and the URL of the call.
+    """
+
+    logger.info("Starting %s method.", call["method"])
+    logger.info("URL: %s", call["url"])
+    return send(call)
+
+
+def auth_refresh_middleware(
+    call: dict, send: Callable, handler: Callable[[dict], bool]
+) -> requests.Response:
+    """
+    Retry a call with an expired token once with refreshed headers.
+    """
+
+    response = send(call)
+    if (
+        response.status_code == 401
+        and call["expected_status_code"] != 401
+        and handler(call["headers"])
+    ):
+        logger.info("Retry %s with refreshed token.", call["method"])
+        response = send(call)
+    return response
+
+
+def retry_middleware(
+    call: dict, send: Callable, retries: int, backoff_s: float
+) -> requests.Response:
+    """
+    Retry an idempotent call on connection errors and gateway errors.
+    """
+
+    if call["method"] not in IDEMPOTENT_METHODS:
+        return send(call)
+
+    attempt = 0
+    while True:
+        try:
+            response = send(call)
+        except requests.ConnectionError as e:
+            if attempt >= retries:
+                raise
+            logger.warning("%s failed: %s, retry.", call["method"], e)
+        else:
+            if (
+                response.status_code not in RETRY_STATUS_CODES
+                or response.status_code == call["expected_status_code"]
+                or attempt >= retries
+            ):
+                return response
+            logger.warning(
+                "%s returned %s, retry.", call["method"], response.status_code
+            )
+
+        time.sleep(backoff_s * 2**attempt)
+        attempt += 1
+
+
+def timing_middleware(call: dict, send: Callable) -> requests.Response:
+    """
+    Add the time of the network call to the latency histograms.
+    """
+
+    start = time.perf_counter()
+    response = send(call)
+    # `elapsed` stops when the response headers are parsed.
+    LatencyStats.record(
+        call["method"],
+        call["endpoint"],
+        total_ms=(time.perf_counter() - start) * 1000,
+        ttfb_ms=response.elapsed.total_seconds() * 1000,
+    )
+    return response
+
+
+def record_middleware(call: dict, send: Callable) -> requests.Response:
+    """
+    Append the call and its response to the API record log.
+    """
+
+    response = send(call)
+    ApiRecorder.record(
+        call["method"], call["endpoint"], call["json"], response
+    )
+    return response
+
+
+# pylint: disable=too-many-arguments
+def build_chain(
+    *,
+    log: bool,
+    unauthorized_handler: Callable[[dict], bool] | None,
+    retries: int,
+    retry_backoff_s: float,
+    latency_stats: bool,
+    record_mode: str,
+) -> Callable[[dict], requests.Response]:
+    """
+    Chain the enabled middleware around the transport.
+
+    The order from the outside is: logging, auth refresh, retry,
+    timing, recording, transport. Replayed calls are not timed.
+    """
+
+    if record_mode == "replay":
+        send = replay_transport
+    else:
+        send = session_transport
+        if record_mode == "record":
+            send = partial(record_middleware, send=send)
+        if latency_stats:
+            send = partial(timing_middleware, send=send)
+
+    if retries:
+        send = partial(
+            retry_middleware,
+            send=send,
+            retries=retries,
+            backoff_s=retry_backoff_s,
+        )
+    if unauthorized_handler is not None:
+        send = partial(
+            auth_refresh_middleware, send=send, handler=unauthorized_handler
+        )
+    if log:
+        send = partial(logging_middleware, send=send)
+
+    return send
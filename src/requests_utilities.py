@@ -4,21 +4,182 @@ This module provides a utility class for making HTTP requests.
 
 import logging as logger
 import os
+import threading
+import time
+from collections.abc import Callable
+from http.cookiejar import DefaultCookiePolicy
 
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 
+from src.api_recorder import ApiRecorder
 from src.hosts_config import API_HOSTS
+from src.latency_stats import LatencyBudget, LatencyStats
+from src.request_middleware import build_chain
 
 load_dotenv()
 
 
+class SessionPool:
+    """
+    A process-wide keep-alive HTTP session shared by all API clients.
+
+    The underlying urllib3 connection pool is thread-safe, so one session
+    serves every RequestUtilities instance and every helper built on top
+    of it. The pool size is read from the API_POOL_SIZE variable and is
+    raised by callers that run more workers, see `configure`.
+    """
+
+    _lock = threading.Lock()
+    _session: requests.Session | None = None
+    _retired_adapters: list = []
+    _closed_stats = {"new": 0, "reused": 0}
+
+    pool_size: int = int(os.getenv("API_POOL_SIZE", "10"))
+
+    @classmethod
+    def get_session(cls) -> requests.Session:
+        """
+        Return the shared session, creating it on first use.
+        """
+
+        if cls._session is None:
+            with cls._lock:
+                if cls._session is None:
+                    logger.info(
+                        "Create shared HTTP session, pool size: %s.",
+                        cls.pool_size,
+                    )
+                    session = requests.Session()
+                    # Every call passes its own Authorization header,
+                    # cookies must not leak between tests.
+                    session.cookies.set_policy(
+                        DefaultCookiePolicy(allowed_domains=[])
+                    )
+                    cls.__mount(session)
+                    cls._session = session
+        return cls._session
+
+    @classmethod
+    def configure(cls, pool_size: int):
+        """
+        Grow the connection pool to at least `pool_size` connections.
+
+        Callers raise it to their concurrency, e.g. the number of load
+        workers. A live session gets a larger adapter, the old one keeps
+        serving requests in flight and is closed with the session.
+        """
+
+        with cls._lock:
+            if pool_size <= cls.pool_size:
+                return
+
+            logger.info("Grow HTTP connection pool to %s.", pool_size)
+            cls.pool_size = pool_size
+            if cls._session is not None:
+                cls._retired_adapters.extend(
+                    set(cls._session.adapters.values())
+                )
+                cls.__mount(cls._session)
+
+    @classmethod
+    def __mount(cls, session: requests.Session):
+        """
+        Mount an adapter with a pool of `pool_size` connections.
+        """
+
+        adapter = HTTPAdapter(
+            pool_connections=cls.pool_size,
+            pool_maxsize=cls.pool_size,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+    @classmethod
+    def stats(cls) -> dict:
+        """
+        Return the number of new and reused connections.
+        """
+
+        with cls._lock:
+            return cls.__collect_stats()
+
+    @classmethod
+    def merge(cls, stats: dict):
+        """
+        Add connection counters of another process, e.g. an xdist worker.
+        """
+
+        with cls._lock:
+            cls._closed_stats = {
+                key: cls._closed_stats[key] + stats.get(key, 0)
+                for key in ("new", "reused")
+            }
+
+    @classmethod
+    def __collect_stats(cls) -> dict:
+        """
+        Sum connection counters of the live session and closed sessions.
+        """
+
+        new_connections = cls._closed_stats["new"]
+        requests_count = new_connections + cls._closed_stats["reused"]
+
+        if cls._session is not None:
+            adapters = set(cls._session.adapters.values())
+            for adapter in adapters.union(cls._retired_adapters):
+                pools = adapter.poolmanager.pools
+                for key in pools.keys():
+                    pool = pools.get(key)
+                    if pool is None:
+                        continue
+                    new_connections += pool.num_connections
+                    requests_count += pool.num_requests
+
+        return {
+            "new": new_connections,
+            "reused": max(requests_count - new_connections, 0),
+        }
+
+    @classmethod
+    def close(cls):
+        """
+        Close the shared session and all of its connections.
+        """
+
+        with cls._lock:
+            if cls._session is not None:
+                cls._closed_stats = cls.__collect_stats()
+                cls._session.close()
+                cls._session = None
+                for adapter in cls._retired_adapters:
+                    adapter.close()
+                cls._retired_adapters.clear()
+
+
+# pylint: disable=too-many-arguments
 # pylint: disable=too-many-instance-attributes
 class RequestUtilities:
     """
     A utility class for sending HTTP requests and handling API responses.
+
+    All methods go through one request core. The core sends the call
+    through a chain of middleware (logging, auth refresh, retry, timing,
+    recording) built for the current settings, see build_chain.
     """
 
+    # Called with the request headers when a request gets an unexpected 401.
+    # Returns True if the headers were refreshed and the request
+    # may be retried.
+    unauthorized_handler: Callable[[dict], bool] | None = None
+
+    # Retries of idempotent calls on connection and gateway errors.
+    retries: int = int(os.getenv("API_RETRIES", "0"))
+    retry_backoff_s: float = 0.5
+
+    _chains: dict = {}
+
     @staticmethod
     def get_base_url():
         """
@@ -29,6 +190,35 @@ class RequestUtilities:
         base_url = API_HOSTS[env]
         return base_url
 
+    @classmethod
+    def get_chain(cls) -> Callable[[dict], requests.Response]:
+        """
+        Return the middleware chain for the current settings.
+
+        Chains are cached, so a changed setting takes effect
+        on the next call without rebuilding the chain on every call.
+        """
+
+        key = (
+            logger.getLogger().isEnabledFor(logger.INFO),
+            cls.unauthorized_handler,
+            cls.retries,
+            cls.retry_backoff_s,
+            LatencyStats.enabled,
+            ApiRecorder.mode,
+        )
+        chain = cls._chains.get(key)
+        if chain is None:
+            chain = cls._chains[key] = build_chain(
+                log=key[0],
+                unauthorized_handler=cls.unauthorized_handler,
+                retries=cls.retries,
+                retry_backoff_s=cls.retry_backoff_s,
+                latency_stats=LatencyStats.enabled,
+                record_mode=ApiRecorder.mode,
+            )
+        return chain
+
     def __init__(self):
         self.__env = os.getenv("ENV", "test")
         self.base_url: str = API_HOSTS[self.__env]
@@ -36,54 +226,63 @@ class RequestUtilities:
         self.status_code: int | None = None
         self.expected_status_code: int | None = None
         self.url: str | None = None
+        self.elapsed_ms: float | None = None
 
         self.response_api = None
         self.response_json = None
 
-        self.EMPTY_CONTENT_LENGTH = "0"  # pylint: disable=invalid-name
+        self.session = SessionPool.get_session()
 
-    def __assert_status_code(self):
-        """
-        Validate the status code of the latest API response.
-        """
-
-        logger.info("Status code check.")
-        assert self.status_code == self.expected_status_code, (
-            f"Bad status code. "
-            f"Expected status code: {self.expected_status_code}, "
-            f"actual status code: {self.status_code}"
-        )
-        logger.info("Status is %s", self.status_code)
+        self.EMPTY_CONTENT_LENGTH = "0"  # pylint: disable=invalid-name
 
-    def get(
+    def __call(
         self,
+        method: str,
         endpoint: str,
-        headers: dict | None = None,
-        expected_status_code=200,
+        headers: dict | None,
+        expected_status_code: int,
+        *,
+        max_ms: float | None,
+        payload: dict | None = None,
+        timeout: int = 10,
     ):
         """
-        Perform a GET request to the specified API endpoint.
-        """
+        Send a request through the middleware chain and check the response.
 
-        logger.info("Starting GET method.")
+        Returns the response body, or None for DELETE, an empty body
+        or a call without a payload.
+        """
 
         if not headers:
             headers = {"Content-Type": "application/json"}
-        else:
+        elif method != "DELETE":
+            # Updated in place, so a refreshed token reaches the caller.
             headers.update({"Content-Type": "application/json"})
 
         self.url = self.base_url + endpoint
-        logger.info("URL: %s", self.url)
-
         self.expected_status_code = expected_status_code
 
-        self.response_api = requests.get(
-            url=self.url,
-            headers=headers,
-            timeout=5,
+        start = time.perf_counter()
+        self.response_api = self.get_chain()(
+            {
+                "method": method,
+                "url": self.url,
+                "endpoint": endpoint,
+                "headers": headers,
+                "json": payload,
+                "timeout": timeout,
+                "expected_status_code": expected_status_code,
+                "session": self.session,
+            }
         )
+        self.elapsed_ms = (time.perf_counter() - start) * 1000
+
         self.status_code = self.response_api.status_code
         self.__assert_status_code()
+        self.__assert_latency(method, endpoint, max_ms)
+
+        if method == "DELETE":
+            return None
 
         if (
             self.response_api.headers.get("Content-Length")
@@ -92,186 +291,146 @@ class RequestUtilities:
             logger.info("Response has empty body (Content-Length: 0)")
             return None
 
+        if payload is None and method != "GET":
+            return None
+
         self.response_json = self.response_api.json()
 
-        logger.info("GET API response %s", self.response_json)
+        logger.info("%s API response %s", method, self.response_json)
 
         return self.response_json
 
+    def __assert_status_code(self):
+        """
+        Validate the status code of the latest API response.
+        """
+
+        logger.info("Status code check.")
+        assert self.status_code == self.expected_status_code, (
+            f"Bad status code. "
+            f"Expected status code: {self.expected_status_code}, "
+            f"actual status code: {self.status_code}"
+        )
+        logger.info("Status is %s", self.status_code)
+
+    def __assert_latency(
+        self, method: str, endpoint: str, max_ms: float | None
+    ):
+        """
+        Check the latest call against its latency budget.
+
+        The budget is `max_ms`, or the endpoint budget from
+        LATENCY_BUDGETS. A breach is recorded, and fails the call
+        only in strict mode.
+        """
+
+        breach = LatencyBudget.check(
+            method=method,
+            endpoint=endpoint,
+            elapsed_ms=self.elapsed_ms,
+            max_ms=max_ms,
+        )
+        assert breach is None or not LatencyBudget.strict, breach
+
+    def get(
+        self,
+        endpoint: str,
+        headers: dict | None = None,
+        expected_status_code=200,
+        *,
+        max_ms: float | None = None,
+    ):
+        """
+        Perform a GET request to the specified API endpoint.
+        """
+
+        return self.__call(
+            "GET",
+            endpoint,
+            headers,
+            expected_status_code,
+            max_ms=max_ms,
+            timeout=5,
+        )
+
     def post(
         self,
         endpoint: str,
         payload: dict | None = None,
         headers: dict | None = None,
         expected_status_code=200,
+        *,
+        max_ms: float | None = None,
     ):
         """
         Perform a POST request to the specified API endpoint.
         """
 
-        logger.info("Starting POST method.")
-
-        if not headers:
-            headers = {"Content-Type": "application/json"}
-        else:
-            headers.update({"Content-Type": "application/json"})
-
-        self.url = self.base_url + endpoint
-        logger.info("URL: %s", self.url)
-
-        self.expected_status_code = expected_status_code
-
-        self.response_api = requests.post(
-            url=self.url,
-            json=payload,
-            headers=headers,
-            timeout=10,
+        return self.__call(
+            "POST",
+            endpoint,
+            headers,
+            expected_status_code,
+            max_ms=max_ms,
+            payload=payload,
         )
 
-        self.status_code = self.response_api.status_code
-
-        self.__assert_status_code()
-
-        if (
-            self.response_api.headers.get("Content-Length")
-            == self.EMPTY_CONTENT_LENGTH
-        ):
-            logger.info("Response has empty body (Content-Length: 0)")
-            return None
-
-        if payload is None:
-            return None
-
-        self.response_json = self.response_api.json()
-
-        logger.info("POST API response %s", self.response_json)
-
-        return self.response_json
-
     def put(
         self,
         endpoint: str,
         payload: dict | None = None,
         headers: dict | None = None,
         expected_status_code=200,
+        *,
+        max_ms: float | None = None,
     ):
         """
         Perform a PUT request to the specified API endpoint.
         """
 
-        logger.info("Starting PUT method.")
-
-        if not headers:
-            headers = {"Content-Type": "application/json"}
-        else:
-            headers.update({"Content-Type": "application/json"})
-
-        self.url = self.base_url + endpoint
-        logger.info("URL: %s", self.url)
-
-        self.expected_status_code = expected_status_code
-
-        self.response_api = requests.put(
-            url=self.url,
-            json=payload,
-            headers=headers,
-            timeout=10,
+        return self.__call(
+            "PUT",
+            endpoint,
+            headers,
+            expected_status_code,
+            max_ms=max_ms,
+            payload=payload,
         )
 
-        self.status_code = self.response_api.status_code
-
-        self.__assert_status_code()
-
-        if (
-            self.response_api.headers.get("Content-Length")
-            == self.EMPTY_CONTENT_LENGTH
-        ):
-            logger.info("Response has empty body (Content-Length: 0)")
-            return None
-
-        if payload is None:
-            return None
-
-        self.response_json = self.response_api.json()
-
-        logger.info("PUT API response %s", self.response_json)
-
-        return self.response_json
-
     def patch(
         self,
         endpoint: str,
         payload: dict | None = None,
         headers: dict | None = None,
         expected_status_code=200,
+        *,
+        max_ms: float | None = None,
     ):
         """
         Perform a PATCH request to the specified API endpoint.
         """
 
-        logger.info("Starting PATCH method.")
-
-        if not headers:
-            headers = {"Content-Type": "application/json"}
-        else:
-            headers.update({"Content-Type": "application/json"})
-
-        self.url = self.base_url + endpoint
-        logger.info("URL: %s", self.url)
-
-        self.expected_status_code = expected_status_code
-
-        self.response_api = requests.patch(
-            url=self.url,
-            json=payload,
-            headers=headers,
-            timeout=10,
+        return self.__call(
+            "PATCH",
+            endpoint,
+            headers,
+            expected_status_code,
+            max_ms=max_ms,
+            payload=payload,
         )
 
-        self.status_code = self.response_api.status_code
-
-        self.__assert_status_code()
-
-        if (
-            self.response_api.headers.get("Content-Length")
-            == self.EMPTY_CONTENT_LENGTH
-        ):
-            logger.info("Response has empty body (Content-Length: 0)")
-            return None
-
-        if payload is None:
-            return None
-
-        self.response_json = self.response_api.json()
-
-        logger.info("PATCH API response %s", self.response_json)
-
-        return self.response_json
-
     def delete(
         self,
         endpoint: str,
         headers: dict | None = None,
         expected_status_code=200,
+        *,
+        max_ms: float | None = None,
     ):
         """
         Perform a DELETE request to the specified API endpoint.
         """
 
-        logger.info("Starting DELETE method.")
-
-        if not headers:
-            headers = {"Content-Type": "application/json"}
-
-        self.url = self.base_url + endpoint
-        logger.info("URL: %s", self.url)
-
-        self.expected_status_code = expected_status_code
-
-        self.response_api = requests.delete(
-            url=self.url,
-            headers=headers,
-            timeout=10,
+        self.__call(
+            "DELETE", endpoint, headers, expected_status_code, max_ms=max_ms
         )
-        self.status_code = self.response_api.status_code
-        self.__assert_status_code()
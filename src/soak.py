@@ -0,0 +1,423 @@
+"""
+This module runs a long soak test of the contacts CRUD flow.
+
+Workers repeat the flow of `tests/api_tests/test_contacts.py` (create,
+get, update with PUT and PATCH, delete, get the deleted contact)
+until the duration is over:
+
+    python -m src.soak --duration 7200 --window 60 --output soak.csv
+
+Latency is sampled per time window. Every window is written as one
+CSV row, and a window whose p95 grows above the baseline is reported
+as drift. The driver keeps only the current window in memory.
+
+With `--local` the soak goes to the local stand-in API.
+"""
+
+import argparse
+import csv
+import logging as logger
+import os
+import resource
+import threading
+import time
+
+from src.helpers.contacts_helper import ContactsHelper
+from src.helpers.users_helper import UsersHelper
+from src.latency_stats import LatencyBudget, LatencyHistogram
+from src.payload_factory import PayloadFactory
+from src.requests_utilities import SessionPool
+
+CSV_COLUMNS = (
+    "t_s",
+    "cycles",
+    "errors",
+    "p50_ms",
+    "p95_ms",
+    "p99_ms",
+    "max_ms",
+    "breaches",
+    "rss_mb",
+    "drift",
+)
+
+
+def get_rss_mb() -> float:
+    """
+    Return the resident memory of the process in MB.
+    """
+
+    try:
+        with open("/proc/self/statm", encoding="utf-8") as file:
+            pages = int(file.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError, IndexError):
+        # Peak memory where /proc is not available (KB on Linux, B on macOS).
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2**10
+
+
+class TrendLine:
+    """
+    A least squares line fitted with running sums in constant memory.
+    """
+
+    def __init__(self):
+        self.n = 0
+        self.sum_x = 0.0
+        self.sum_y = 0.0
+        self.sum_xy = 0.0
+        self.sum_xx = 0.0
+
+    def add(self, x: float, y: float):
+        """
+        Add one point.
+        """
+
+        self.n += 1
+        self.sum_x += x
+        self.sum_y += y
+        self.sum_xy += x * y
+        self.sum_xx += x * x
+
+    def slope(self) -> float:
+        """
+        Return the slope of the line, 0 for less than two points.
+        """
+
+        denominator = self.n * self.sum_xx - self.sum_x**2
+        if self.n < 2 or not denominator:
+            return 0.0
+        return (self.n * self.sum_xy - self.sum_x * self.sum_y) / denominator
+
+
+# pylint: disable=too-many-instance-attributes,too-few-public-methods
+# pylint: disable=too-many-arguments
+class SoakRunner:
+    """
+    Class that repeats the contacts CRUD flow and tracks latency drift.
+
+    A window is drifting when its p95 is more than `drift_ratio` times
+    the average p95 of the first `baseline_windows` windows.
+    """
+
+    def __init__(
+        self,
+        output: str,
+        *,
+        window_s: float = 60.0,
+        workers: int = 1,
+        drift_ratio: float = 1.5,
+        baseline_windows: int = 3,
+    ):
+        self.output = output
+        self.window_s = window_s
+        self.workers = workers
+        SessionPool.configure(workers)
+        self.drift_ratio = drift_ratio
+        self.baseline_windows = max(baseline_windows, 1)
+
+        self.__lock = threading.Lock()
+        self.__stop = threading.Event()
+        self.__headers: dict = {}
+
+        self.__histogram = LatencyHistogram()
+        self.__cycles = 0
+        self.__errors = 0
+
+        self.__baseline: list = []
+        self.drift_windows = 0
+        self.latency_trend = TrendLine()
+        self.rss_trend = TrendLine()
+
+    def run(self, duration: float) -> dict:
+        """
+        Run the soak and return its summary.
+        """
+
+        user_rs_api, user_info = UsersHelper().create_user(auth_headers={})
+        self.__headers = {"Authorization": f"Bearer {user_rs_api['token']}"}
+        logger.info("Soak account: %s", user_info["email"])
+
+        # The account is deleted on errors and Ctrl+C too.
+        try:
+            threads = [
+                threading.Thread(target=self.__work, daemon=True)
+                for _ in range(self.workers)
+            ]
+
+            start = time.perf_counter()
+            with open(self.output, "w", newline="", encoding="utf-8") as file:
+                writer = csv.writer(file)
+                writer.writerow(CSV_COLUMNS)
+
+                for thread in threads:
+                    thread.start()
+
+                try:
+                    window_end = start + self.window_s
+                    while window_end <= start + duration:
+                        time.sleep(max(window_end - time.perf_counter(), 0))
+                        writer.writerow(
+                            self.__close_window(window_end - start)
+                        )
+                        file.flush()
+                        window_end += self.window_s
+                finally:
+                    self.__stop.set()
+                    for thread in threads:
+                        thread.join()
+        finally:
+            UsersHelper().delete_user(auth_headers=dict(self.__headers))
+
+        return {
+            "windows": self.latency_trend.n,
+            "drift_windows": self.drift_windows,
+            "p95_slope_ms_per_h": round(self.latency_trend.slope() * 3600, 2),
+            "rss_slope_mb_per_h": round(self.rss_trend.slope() * 3600, 2),
+            "output": self.output,
+        }
+
+    def __work(self):
+        """
+        Repeat the CRUD flow until the soak is stopped.
+        """
+
+        contacts_helper = ContactsHelper()
+        while not self.__stop.is_set():
+            try:
+                self.__cycle(contacts_helper)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.debug("Soak cycle failed: %s", e)
+                with self.__lock:
+                    self.__errors += 1
+                continue
+
+            with self.__lock:
+                self.__cycles += 1
+
+    def __cycle(self, contacts_helper: ContactsHelper):
+        """
+        Run the CRUD flow once, timing every request.
+        """
+
+        headers = dict(self.__headers)
+
+        contact_rs_api, _ = self.__timed(
+            contacts_helper.create_contact, auth_headers=headers
+        )
+        contact_id = contact_rs_api["_id"]
+
+        try:
+            self.__timed(
+                contacts_helper.get_contacts,
+                auth_headers=headers,
+                contact_id=contact_id,
+            )
+            self.__timed(
+                contacts_helper.update,
+                auth_headers=headers,
+                payload=ContactsHelper.generate_contact_payload(),
+                contact_id=contact_id,
+            )
+            self.__timed(
+                contacts_helper.update,
+                auth_headers=headers,
+                payload={"firstName": "Soak"},
+                contact_id=contact_id,
+            )
+            self.__timed(
+                contacts_helper.delete_contact,
+                auth_headers=headers,
+                contact_id=contact_id,
+            )
+        except Exception:
+            # A failed cycle must not leave its contact behind.
+            self.__delete_contact(contacts_helper, headers, contact_id)
+            raise
+        self.__timed(
+            contacts_helper.get_contacts,
+            auth_headers=headers,
+            contact_id=contact_id,
+            expected_status_code=404,
+        )
+
+        # Drop the last response, the helper is reused for the next cycle.
+        contacts_helper.request_utility.response_api = None
+        contacts_helper.request_utility.response_json = None
+
+    @staticmethod
+    def __delete_contact(
+        contacts_helper: ContactsHelper, headers: dict, contact_id: str
+    ):
+        """
+        Delete the contact of a failed cycle, untimed.
+        """
+
+        try:
+            contacts_helper.delete_contact(
+                auth_headers=headers, contact_id=contact_id, missing_ok=True
+            )
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.debug("Soak contact %s not deleted: %s", contact_id, e)
+
+    def __timed(self, method, **kwargs):
+        """
+        Call a helper method and add its time to the current window.
+        """
+
+        start = time.perf_counter()
+        result = method(**kwargs)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        with self.__lock:
+            self.__histogram.add(elapsed_ms)
+        return result
+
+    def __close_window(self, t_s: float) -> tuple:
+        """
+        Start a new window and return the row of the finished one.
+        """
+
+        with self.__lock:
+            histogram, self.__histogram = self.__histogram, LatencyHistogram()
+            cycles, self.__cycles = self.__cycles, 0
+            errors, self.__errors = self.__errors, 0
+
+        breaches = sum(LatencyBudget.counts().values())
+        LatencyBudget.reset()
+
+        p95 = histogram.percentile(95)
+        rss_mb = get_rss_mb()
+        drift = self.__check_drift(p95)
+
+        self.latency_trend.add(t_s, p95)
+        self.rss_trend.add(t_s, rss_mb)
+
+        logger.warning(
+            "Window %.0f s: %s cycles, %s errors, p95 %.1f ms, RSS %.1f MB.",
+            t_s,
+            cycles,
+            errors,
+            p95,
+            rss_mb,
+        )
+
+        return (
+            round(t_s, 1),
+            cycles,
+            errors,
+            round(histogram.percentile(50), 1),
+            round(p95, 1),
+            round(histogram.percentile(99), 1),
+            round(histogram.max_seen_ms, 1),
+            breaches,
+            round(rss_mb, 1),
+            int(drift),
+        )
+
+    def __check_drift(self, p95: float) -> bool:
+        """
+        Compare the window p95 with the baseline windows.
+        """
+
+        if len(self.__baseline) < self.baseline_windows:
+            self.__baseline.append(p95)
+            return False
+
+        baseline = sum(self.__baseline) / len(self.__baseline)
+        if baseline and p95 > baseline * self.drift_ratio:
+            self.drift_windows += 1
+            logger.warning(
+                "Latency drift: p95 %.1f ms, baseline %.1f ms.",
+                p95,
+                baseline,
+            )
+            return True
+        return False
+
+
+def main(argv: list | None = None):
+    """
+    Run the soak from the command line.
+    """
+
+    parser = argparse.ArgumentParser(
+        prog="python -m src.soak", description=__doc__.split("\n\n")[1]
+    )
+    parser.add_argument(
+        "--duration", type=float, required=True, help="Run time in seconds"
+    )
+    parser.add_argument(
+        "--window", type=float, default=60.0, help="Window in seconds"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=1, help="Number of parallel flows"
+    )
+    parser.add_argument(
+        "--drift_ratio",
+        type=float,
+        default=1.5,
+        help="Window p95 to baseline p95 ratio reported as drift",
+    )
+    parser.add_argument(
+        "--baseline_windows",
+        type=int,
+        default=3,
+        help="Number of first windows averaged as the baseline",
+    )
+    parser.add_argument(
+        "--output", default="soak.csv", help="Time series CSV file"
+    )
+    parser.add_argument(
+        "--local",
+        action="store_true",
+        help="Start the local stand-in API and soak it",
+    )
+    parser.add_argument(
+        "--verbose", action="store_true", help="Log every request"
+    )
+    args = parser.parse_args(argv)
+
+    # Request logs (INFO) are shown only with --verbose, windows
+    # and drift are logged at WARNING and are always shown.
+    logger.basicConfig(
+        level=logger.INFO if args.verbose else logger.WARNING,
+        format="%(asctime)s - %(levelname)s - %(message)s",
+    )
+
+    local_api = None
+    if args.local:
+        # pylint: disable=import-outside-toplevel
+        from src.hosts_config import LOCAL_API_PORT
+        from src.local_api import start_local_api
+
+        os.environ["ENV"] = "local"
+        local_api = start_local_api(LOCAL_API_PORT)
+
+    # Payloads are pre-generated off the timed calls.
+    PayloadFactory.configure(prefill=True, kinds=("contact",))
+
+    try:
+        summary = SoakRunner(
+            output=args.output,
+            window_s=args.window,
+            workers=args.workers,
+            drift_ratio=args.drift_ratio,
+            baseline_windows=args.baseline_windows,
+        ).run(duration=args.duration)
+    finally:
+        SessionPool.close()
+        if local_api is not None:
+            local_api.stop()
+
+    print(
+        f"windows: {summary['windows']}, "
+        f"drift windows: {summary['drift_windows']}, "
+        f"p95 slope: {summary['p95_slope_ms_per_h']} ms/h, "
+        f"RSS slope: {summary['rss_slope_mb_per_h']} MB/h, "
+        f"time series: {summary['output']}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -7,28 +7,42 @@ for running Selenium-based and API-based tests.
 # pylint: disable=redefined-outer-name
 # pylint: disable=unused-argument
 
+import asyncio
 import logging as logger
 import os
+import time
 
 import pytest
 from dotenv import load_dotenv
 from faker import Faker
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.firefox.options import Options
 from selenium.webdriver.firefox.service import Service as FirefoxService
 
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.wait import WebDriverWait
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
 
+from src.api_recorder import ApiRecorder
+from src.browser_options import (
+    BROWSER_PROFILES,
+    chrome_options,
+    firefox_options,
+)
+from src.browser_pool import BrowserPool
+from src.driver_resolver import DEFAULT_DRIVER_CACHE, DriverResolver
+from src.helpers.async_contacts_helper import AsyncContactsHelper
 from src.helpers.contacts_helper import ContactsHelper
+from src.helpers.token_broker import TokenBroker
+from src.helpers.users_helper import UsersHelper
+from src.hosts_config import LOCAL_API_PORT
+from src.latency_stats import LatencyBudget, LatencyStats
+from src.local_api import LocalApiServer, start_local_api
 from src.pages.add_new_contact_page import AddNewContactPage
 from src.pages.contact_details_page import ContactDetailsPage
 from src.pages.contact_list_page import ContactListPage
 from src.pages.login_page import LoginPage
-from src.requests_utilities import RequestUtilities
+from src.payload_factory import PayloadFactory, derive_seed
+from src.requests_utilities import RequestUtilities, SessionPool
 
 load_dotenv()
 
@@ -36,6 +50,26 @@ firefox_path = os.getenv("FIREFOX_PATH")
 
 base_url = RequestUtilities.get_base_url()
 
+browser_pool_key = pytest.StashKey[BrowserPool]()
+driver_resolver_key = pytest.StashKey[DriverResolver]()
+local_api_key = pytest.StashKey[LocalApiServer]()
+
+LATENCY_COLUMNS = ("calls", "p50", "p95", "p99", "max", "ttfb_p50")
+
+# API field names of the `create_contact_info` values, in the same order.
+CONTACT_INFO_FIELDS = (
+    "firstName",
+    "lastName",
+    "birthdate",
+    "email",
+    "phone",
+    "street1",
+    "city",
+    "stateProvince",
+    "postalCode",
+    "country",
+)
+
 
 def pytest_addoption(parser):
     """
@@ -43,7 +77,19 @@ def pytest_addoption(parser):
 
     Options:
     - `--rm`: Enables automatic deletion of created contacts after tests.
+    - `--rm_strategy`: How UI tests delete contacts (api or ui).
+    - `--rm_workers`: Number of parallel workers for API deletion.
+    - `--isolated_accounts`: Run tests under a new account of the process.
     - `--browser_name`: Specifies the browser to use (chrome or firefox).
+    - `--browser_reuse`: Number of tests run in one browser before restart.
+    - `--browser_profile`: Browser settings preset (default or lean).
+    - `--driver_dir`: Local directory with drivers (offline mode).
+    - `--driver_cache`: File with resolved driver paths.
+    - `--token_cache`: File for keeping the API token between runs.
+    - `--login_mode`: How UI tests log in (form or cookie).
+    - `--contact_setup`: How UI preconditions create contacts (ui or api).
+    - `--latency_strict`: Fail API calls slower than their latency budget.
+    - `--data_seed`: Seed of the test data, stable per test node id.
     """
 
     parser.addoption(
@@ -52,167 +98,641 @@ def pytest_addoption(parser):
         default=False,
         help="Delete a created contact after a test",
     )
+    parser.addoption(
+        "--rm_strategy",
+        action="store",
+        default="api",
+        choices=("api", "ui"),
+        help="Delete contacts after UI tests through the API or the UI",
+    )
+    parser.addoption(
+        "--rm_workers",
+        action="store",
+        type=int,
+        default=SessionPool.pool_size,
+        help="Number of parallel workers for API contacts deletion",
+    )
+    parser.addoption(
+        "--isolated_accounts",
+        action="store_true",
+        default=False,
+        help="Create a separate account for the test process "
+        "(always on with pytest-xdist)",
+    )
     parser.addoption(
         "--browser_name",
         action="store",
         default="firefox",
         help="Choose browser: chrome or firefox",
     )
+    parser.addoption(
+        "--browser_reuse",
+        action="store",
+        type=int,
+        default=20,
+        help="Number of tests run in one browser before it is restarted",
+    )
+    parser.addoption(
+        "--browser_profile",
+        action="store",
+        default="default",
+        choices=BROWSER_PROFILES,
+        help="Browser settings preset: default or lean (headless, "
+        "no images, fonts and animations, eager page load)",
+    )
+    parser.addoption(
+        "--driver_dir",
+        action="store",
+        default=os.getenv("DRIVER_DIR"),
+        help="Take geckodriver/chromedriver only from this directory "
+        "(offline mode)",
+    )
+    parser.addoption(
+        "--driver_cache",
+        action="store",
+        default=DEFAULT_DRIVER_CACHE,
+        help="File with driver paths resolved for each browser version",
+    )
+    parser.addoption(
+        "--token_cache",
+        action="store",
+        default=None,
+        help="Keep the API token in this file between runs",
+    )
+    parser.addoption(
+        "--login_mode",
+        action="store",
+        default="form",
+        choices=("form", "cookie"),
+        help="Log in UI tests through the login form or the auth cookie",
+    )
+    parser.addoption(
+        "--contact_setup",
+        action="store",
+        default="ui",
+        choices=("ui", "api"),
+        help="Create precondition contacts through the UI form or the API",
+    )
+    parser.addoption(
+        "--latency_strict",
+        action="store_true",
+        default=False,
+        help="Fail API calls slower than their latency budget "
+        "(otherwise breaches are only reported)",
+    )
+    parser.addoption(
+        "--data_seed",
+        "--data-seed",
+        action="store",
+        type=int,
+        default=None,
+        help="Generate the same test data in every run: payloads of each "
+        "test are seeded from this seed and the test node id",
+    )
 
 
-@pytest.fixture(scope="module")
-def auth_headers():
+def is_xdist_controller(config) -> bool:
     """
-    Provides authorization headers for API requests.
+    Check if the process is the pytest-xdist controller, it runs no tests.
     """
 
-    my_email = os.getenv("MY_EMAIL")
-    my_pass = os.getenv("MY_PASSWORD")
+    return bool(config.getoption("numprocesses", None)) and not hasattr(
+        config, "workerinput"
+    )
+
+
+def pytest_configure(config):
+    """
+    Configure the API token broker, latency budgets and the test data seed.
+
+    With `ENV=local` the local stand-in API is started for the process
+    that runs tests, every xdist worker serves its own.
+    """
+
+    if os.getenv("ENV") == "local" and not is_xdist_controller(config):
+        config.stash[local_api_key] = start_local_api(LOCAL_API_PORT)
 
-    request_utility = RequestUtilities()
+    token_cache = config.getoption("--token_cache")
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    if token_cache and worker:
+        token_cache = f"{token_cache}.{worker}"
 
-    logger.info("Login with My Email.")
-    response_json = request_utility.post(
-        endpoint="users/login",
-        payload={"email": my_email, "password": my_pass},
+    TokenBroker.configure(cache_file=token_cache)
+    LatencyBudget.strict = config.getoption("--latency_strict")
+
+    # Seeded payloads are generated on demand and reseeded per test,
+    # the session seed differs per xdist worker.
+    data_seed = config.getoption("--data_seed")
+    if data_seed is not None:
+        PayloadFactory.configure(
+            seed=derive_seed(data_seed, f"session:{worker or 'main'}"),
+            prefill=False,
+        )
+
+    if worker:
+        ApiRecorder.record_file = f"{ApiRecorder.record_file}.{worker}"
+
+
+def pytest_unconfigure(config):
+    """
+    Stop the local stand-in API.
+    """
+
+    local_api = config.stash.get(local_api_key, None)
+    if local_api is not None:
+        local_api.stop()
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """
+    Close the shared HTTP session and the API record log after all tests.
+    """
+
+    SessionPool.close()
+    ApiRecorder.close()
+
+    # pytest-xdist workers send their counters and latency histograms
+    # to the controller.
+    if hasattr(session.config, "workeroutput"):
+        session.config.workeroutput["connections"] = SessionPool.stats()
+        session.config.workeroutput["logins"] = TokenBroker.login_count
+        session.config.workeroutput["latency"] = LatencyStats.export()
+        session.config.workeroutput["breaches"] = LatencyBudget.export()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """
+    Merge connection and login counters, latency histograms and budget
+    breaches of a finished pytest-xdist worker.
+    """
+
+    workeroutput = getattr(node, "workeroutput", {})
+    SessionPool.merge(workeroutput.get("connections", {}))
+    TokenBroker.login_count += workeroutput.get("logins", 0)
+    LatencyStats.merge(workeroutput.get("latency", []))
+    LatencyBudget.merge(workeroutput.get("breaches", {}))
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_html_results_summary(prefix, summary, postfix, session):
+    """
+    Add the API latency table to the pytest-html report.
+    """
+
+    rows = LatencyStats.summary()
+    if not rows:
+        return
+
+    header = "".join(
+        f"<th>{column}</th>" for column in ("method", "endpoint")
+    ) + "".join(f"<th>{column}</th>" for column in LATENCY_COLUMNS)
+    body = "".join(
+        f"<tr><td>{row['method']}</td><td>{row['endpoint']}</td>"
+        + "".join(
+            (
+                f"<td>{row[column]:.0f}</td>"
+                if column != "calls"
+                else f"<td>{row[column]}</td>"
+            )
+            for column in LATENCY_COLUMNS
+        )
+        + "</tr>"
+        for row in rows
+    )
+    prefix.append(
+        f"<h2>API latency, ms</h2><table><tr>{header}</tr>{body}</table>"
+    )
+
+    counts = LatencyBudget.counts()
+    if counts:
+        calls = "".join(
+            f"<li>{call}: {count}</li>" for call, count in counts.items()
+        )
+        items = "".join(
+            f"<li>{breach['test']}: {breach['call']} "
+            f"{breach['elapsed_ms']:.0f} ms &gt; {breach['budget_ms']:g} ms"
+            "</li>"
+            for breach in LatencyBudget.breaches()
+        )
+        prefix.append(
+            f"<h2>Latency budget breaches: {sum(counts.values())}</h2>"
+            f"<ul>{calls}</ul><h3>Samples</h3><ul>{items}</ul>"
+        )
+
+
+def write_latency_breaches(terminalreporter):
+    """
+    Report budget breaches per call and the breach samples.
+    """
+
+    counts = LatencyBudget.counts()
+    if not counts:
+        return
+
+    terminalreporter.write_sep(
+        "-", f"Latency budget breaches: {sum(counts.values())}"
+    )
+    for call, count in counts.items():
+        terminalreporter.write_line(f"{call}: {count}")
+    terminalreporter.write_line("samples:")
+    for breach in LatencyBudget.breaches():
+        terminalreporter.write_line(
+            f"{breach['test']}: {breach['call']} "
+            f"{breach['elapsed_ms']:.0f} ms > {breach['budget_ms']:g} ms"
+        )
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """
+    Report API connections, logins, latency and budget breaches,
+    payload generation, and browser pool usage.
+    """
+
+    connections = SessionPool.stats()
+    terminalreporter.write_sep("-", "API connections")
+    terminalreporter.write_line(
+        f"new: {connections['new']}, reused: {connections['reused']}"
     )
+    terminalreporter.write_line(f"logins: {TokenBroker.login_count}")
+
+    rows = LatencyStats.summary()
+    if rows:
+        terminalreporter.write_sep("-", "API latency, ms")
+        terminalreporter.write_line(
+            f"{'method':<7} {'endpoint':<20} "
+            + " ".join(f"{column:>8}" for column in LATENCY_COLUMNS)
+        )
+        for row in rows:
+            terminalreporter.write_line(
+                f"{row['method']:<7} {row['endpoint']:<20} "
+                f"{row['calls']:>8} "
+                + " ".join(
+                    f"{row[column]:>8.1f}" for column in LATENCY_COLUMNS[1:]
+                )
+            )
+
+    write_latency_breaches(terminalreporter)
+
+    pool = config.stash.get(browser_pool_key, None)
+    if pool is not None:
+        browsers = pool.stats()
+        terminalreporter.write_sep("-", "Browsers")
+        terminalreporter.write_line(
+            f"launches: {browsers['launches']}, "
+            f"reuses: {browsers['reuses']}, "
+            f"recycles: {browsers['recycles']}"
+        )
+
+    payloads = {
+        kind: stats
+        for kind, stats in PayloadFactory.stats().items()
+        if stats["served"]
+    }
+    if payloads:
+        terminalreporter.write_sep("-", "Payloads")
+        for kind, stats in payloads.items():
+            line = (
+                f"{kind}: served {stats['served']}, "
+                f"generated {stats['generated']} ({stats['per_s']:.0f}/s)"
+            )
+            if PayloadFactory.prefill:
+                line += f", buffer hits {stats['buffer_hit_rate']:.0%}"
+            terminalreporter.write_line(line)
+
+    driver_resolver = config.stash.get(driver_resolver_key, None)
+    if driver_resolver is not None:
+        terminalreporter.write_sep("-", "WebDriver")
+        terminalreporter.write_line(
+            f"driver resolution: {driver_resolver.resolve_time:.3f} s"
+        )
+
+
+@pytest.fixture(autouse=True)
+def data_seed(request, pytestconfig):
+    """
+    Provides the test data seed of the test, or None without `--data_seed`.
+
+    The payload factory is reseeded for every test, so a test gets the
+    same payloads in every run regardless of the order of tests.
+    """
+
+    seed = pytestconfig.getoption("--data_seed")
+    if seed is None:
+        return None
 
+    node_seed = derive_seed(seed, request.node.nodeid)
+    PayloadFactory.reseed(node_seed)
+    return node_seed
+
+
+@pytest.fixture()
+def faker(request, data_seed):
+    """
+    Provides a Faker instance seeded for the test.
+
+    Overrides the fixture of the Faker pytest plugin and keeps its
+    `faker_locale`, `faker_session_locale` and `faker_seed` fixtures.
+    Without `faker_seed` it is seeded per test node id with `--data_seed`,
+    otherwise with 0 like the plugin.
+    """
+
+    if "faker_locale" in request.fixturenames:
+        fake = Faker(locale=request.getfixturevalue("faker_locale"))
+    else:
+        fake = request.getfixturevalue("_session_faker")
+
+    if "faker_seed" in request.fixturenames:
+        seed = request.getfixturevalue("faker_seed")
+    else:
+        seed = 0 if data_seed is None else data_seed
+    fake.seed_instance(seed=seed)
+    fake.unique.clear()
+    return fake
+
+
+@pytest.fixture(scope="session")
+def user_account(pytestconfig):
+    """
+    Provides the email and password of the account used by tests.
+
+    With `--isolated_accounts` (always on xdist workers) a new account
+    is created for the process and deleted after the session,
+    otherwise the account from `.env` is used.
+    """
+
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    if not (pytestconfig.getoption("--isolated_accounts") or worker):
+        yield {
+            "email": os.getenv("MY_EMAIL"),
+            "password": os.getenv("MY_PASSWORD"),
+        }
+        return
+
+    logger.info("Create account for worker %s.", worker or "main")
+    users_helper = UsersHelper()
+    user_rs_api, user_info = users_helper.create_user(auth_headers={})
     assert (
-        response_json is not None
+        user_rs_api is not None
     ), "Response is None, but expected JSON response."
-    token = response_json["token"]
 
-    yield {"Authorization": f"Bearer {token}"}
+    yield {"email": user_info["email"], "password": user_info["password"]}
 
-    logger.info("Logout.")
-    request_utility.post(
-        endpoint="users/logout", headers={"Authorization": f"Bearer {token}"}
+    logger.info("Delete account %s.", user_info["email"])
+    users_helper.delete_user(
+        auth_headers={"Authorization": f"Bearer {user_rs_api['token']}"}
+    )
+    TokenBroker.forget(user_info["email"])
+
+
+@pytest.fixture(scope="session")
+def auth_headers(user_account):
+    """
+    Provides authorization headers for API requests.
+
+    The token is shared by the whole session (one login per process)
+    and is refreshed automatically when it expires.
+    """
+
+    logger.info("Login with %s.", user_account["email"])
+    yield TokenBroker.get_headers(
+        email=user_account["email"], password=user_account["password"]
     )
 
+    logger.info("Logout.")
+    TokenBroker.logout()
+
+
+def delete_contact(
+    contacts_helper: ContactsHelper, auth_headers: dict, contact_id: str
+):
+    """
+    Deletes one contact and returns the error, None if it was deleted
+    or is already missing.
+    """
+
+    try:
+        contacts_helper.delete_contact(
+            auth_headers=auth_headers, contact_id=contact_id, missing_ok=True
+        )
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        return e
+    return None
+
 
 @pytest.fixture()
-def manage_contacts(auth_headers, pytestconfig):
+def manage_contacts(request, auth_headers, pytestconfig):
     """
     Manages contact creation and cleanup for API tests.
+
+    The returned callable creates one contact and returns it with its
+    payload, or creates `count` contacts concurrently and returns their
+    ids. Created contacts are deleted concurrently with `--rm`.
+    A single contact is created and deleted without asyncio.
     """
 
     contacts_helper = ContactsHelper()
+    async_contacts_helper = AsyncContactsHelper()
     created_contacts = []
 
-    def create_contact():
-        contact_rs_api, contact_info = contacts_helper.create_contact(
-            auth_headers=auth_headers
-        )
+    def register_contact(contact_rs_api):
         assert (
             contact_rs_api is not None
         ), "Response is None, but expected JSON response."
-        create_contact_id = contact_rs_api["_id"]
-        created_contacts.append(create_contact_id)
-        return contact_rs_api, contact_info
+        created_contacts.append(contact_rs_api["_id"])
+
+    def create_contact(count: int | None = None):
+        if count is None:
+            contact_rs_api, contact_info = contacts_helper.create_contact(
+                auth_headers=auth_headers
+            )
+            register_contact(contact_rs_api)
+            return contact_rs_api, contact_info
+
+        contact_ids, stats = asyncio.run(
+            async_contacts_helper.create_contacts(
+                auth_headers=auth_headers, count=count
+            )
+        )
+        created_contacts.extend(contact_ids)
+        assert not stats["failed"], f"{stats['failed']} contacts not created."
+        return contact_ids
 
     yield create_contact
 
-    if pytestconfig.getoption("--rm"):
-        for contact_id in created_contacts:
-            try:
-                contact = contacts_helper.get_contacts(
-                    auth_headers=auth_headers, contact_id=contact_id
-                )
-                if contact:
-                    contacts_helper.delete_contact(
-                        auth_headers=auth_headers, contact_id=contact_id
-                    )
-                    logger.info("Deleted contact: %s", contact_id)
-            except AssertionError as e:
-                logger.info(
-                    "Contact %s already deleted or not found: %s",
-                    contact_id,
-                    e,
-                )
-            except Exception as e:  # pylint: disable=broad-exception-caught
-                logger.error(
-                    "Error while trying to delete contact %s: %s",
-                    contact_id,
-                    e,
-                )
+    if not pytestconfig.getoption("--rm") or not created_contacts:
+        return
 
+    start = time.perf_counter()
+    if len(created_contacts) == 1:
+        results = [
+            delete_contact(contacts_helper, auth_headers, created_contacts[0])
+        ]
+    else:
+        results = asyncio.run(
+            async_contacts_helper.delete_contacts(
+                auth_headers=auth_headers,
+                contact_ids=created_contacts,
+                missing_ok=True,
+            )
+        )
+    for contact_id, error in zip(created_contacts, results):
+        if error is not None:
+            logger.error(
+                "Error while trying to delete contact %s: %s",
+                contact_id,
+                error,
+            )
 
-@pytest.fixture
-def browser(pytestconfig):
+    logger.info(
+        "Cleanup of %s contacts after %s took %.3f s.",
+        len(created_contacts),
+        request.node.nodeid,
+        time.perf_counter() - start,
+    )
+
+
+def launch_browser(
+    browser_name: str,
+    driver_resolver: DriverResolver,
+    profile: str = "default",
+):
     """
-    Initializes a Selenium WebDriver instance for the specified browser.
+    Starts a Selenium WebDriver instance for the specified browser.
+    """
+
+    if browser_name == "firefox":
+        logger.info("Prepare browser firefox, profile %s.", profile)
+
+        return webdriver.Firefox(
+            service=FirefoxService(
+                driver_resolver.resolve(browser_name, firefox_path)
+            ),
+            options=firefox_options(
+                profile=profile, binary_location=firefox_path
+            ),
+        )
+
+    if browser_name == "chrome":
+        logger.info("Prepare browser chrome, profile %s.", profile)
+
+        return webdriver.Chrome(
+            service=ChromeService(driver_resolver.resolve(browser_name)),
+            options=chrome_options(profile=profile),
+        )
+
+    raise pytest.UsageError("--browser_name should be chrome or firefox")
+
+
+@pytest.fixture(scope="session")
+def browser_pool(pytestconfig):
+    """
+    Provides the pool of browsers shared by UI tests of this process.
     """
 
     browser_name = pytestconfig.getoption("--browser_name")
-    driver = None
+    profile = pytestconfig.getoption("--browser_profile")
+    driver_resolver = DriverResolver(
+        cache_file=pytestconfig.getoption("--driver_cache"),
+        driver_dir=pytestconfig.getoption("--driver_dir"),
+    )
+    pytestconfig.stash[driver_resolver_key] = driver_resolver
 
-    if browser_name == "firefox":
-        logger.info("Prepare browser firefox.")
+    pool = BrowserPool(
+        factory=lambda: launch_browser(browser_name, driver_resolver, profile),
+        max_uses=pytestconfig.getoption("--browser_reuse"),
+    )
+    pytestconfig.stash[browser_pool_key] = pool
 
-        options = Options()
-        if firefox_path:
-            options.binary_location = firefox_path
+    yield pool
 
-            driver = webdriver.Firefox(
-                service=FirefoxService(GeckoDriverManager().install()),
-                options=options,
-            )
+    logger.info("Browser pool close.")
+    pool.close()
 
-    elif browser_name == "chrome":
-        logger.info("Prepare browser chrome.")
 
-        driver = webdriver.Chrome(
-            service=ChromeService(ChromeDriverManager().install())
-        )
+@pytest.fixture
+def browser(browser_pool: BrowserPool):
+    """
+    Provides a Selenium WebDriver instance from the browser pool.
+    """
 
-    else:
-        raise pytest.UsageError("--browser_name should be chrome or firefox")
+    driver = browser_pool.acquire()
 
     yield driver
 
-    logger.info("Browser quit.")
-    if driver:
-        driver.quit()
+    logger.info("Browser release.")
+    browser_pool.release(driver)
+
+
+def delete_all_contacts_ui(browser: webdriver.Firefox | webdriver.Chrome):
+    """
+    Deletes all contacts one by one through the contact list page.
+    """
+
+    link = base_url + "contactList"
+    contact_list_page = ContactListPage(browser=browser, url=link)
+    contact_list_page.open()
+
+    while True:
+        first_contact = contact_list_page.get_first_contact()
+
+        if first_contact:
+            WebDriverWait(browser, 5).until(
+                EC.element_to_be_clickable(first_contact)
+            )
+            first_contact.click()
+            contact_details_page = ContactDetailsPage(
+                browser=browser, url=browser.current_url
+            )
+            contact_details_page.delete_contact()
+            WebDriverWait(browser, 5).until(EC.staleness_of(first_contact))
+            contact_list_page.open()
+        else:
+            break
 
 
 @pytest.fixture()
-def del_all_contacts(
-    request, pytestconfig, browser: webdriver.Firefox | webdriver.Chrome
-):
+def del_all_contacts(request, pytestconfig):
     """
-    Deletes all test contacts from the contact list page
-    (Selenium-based cleanup).
+    Deletes all test contacts after a UI test.
+
+    By default contacts are deleted in parallel through the API,
+    `--rm_strategy=ui` deletes them through the contact list page.
     """
 
+    if not pytestconfig.getoption("--rm"):
+        yield
+        return
+
+    if pytestconfig.getoption("--rm_strategy") == "ui":
+        browser = request.getfixturevalue("browser")
+        yield
+        logger.info("Delete all contacts through UI.")
+        delete_all_contacts_ui(browser)
+        return
+
+    headers = request.getfixturevalue("auth_headers")
     yield
-    if pytestconfig.getoption("--rm"):
-        logger.info("Delete all contacts.")
-        link = base_url + "contactList"
-        contact_list_page = ContactListPage(browser=browser, url=link)
-        contact_list_page.open()
-
-        while True:
-            first_contact = contact_list_page.get_first_contact()
-
-            if first_contact:
-                WebDriverWait(browser, 5).until(
-                    EC.element_to_be_clickable(first_contact)
-                )
-                first_contact.click()
-                contact_details_page = ContactDetailsPage(
-                    browser=browser, url=browser.current_url
-                )
-                contact_details_page.delete_contact()
-                WebDriverWait(browser, 5).until(EC.staleness_of(first_contact))
-                contact_list_page.open()
-            else:
-                break
+    logger.info("Delete all contacts through API.")
+    ContactsHelper().delete_all_contacts(
+        auth_headers=headers, workers=pytestconfig.getoption("--rm_workers")
+    )
 
 
 @pytest.fixture(scope="function")
-def setup_user(browser: webdriver.Firefox | webdriver.Chrome):
+def setup_user(
+    request,
+    browser: webdriver.Firefox | webdriver.Chrome,
+    user_account,
+    pytestconfig,
+):
     """
     Logs in a user using the login page.
+
+    With `--login_mode=cookie` a token of a separate API login is set
+    as the auth cookie instead of submitting the form. Tests marked
+    `form_login` (e.g. logout tests, which revoke the token)
+    always use the form.
     """
 
     logger.info("Setup user with default parameters.")
@@ -220,63 +740,54 @@ def setup_user(browser: webdriver.Firefox | webdriver.Chrome):
     page = LoginPage(browser=browser, url=link)
     page.open()
 
-    email = os.getenv("MY_EMAIL")
-    password = os.getenv("MY_PASSWORD")
+    email = user_account["email"]
+    password = user_account["password"]
+
+    if not (email and password):
+        return
 
-    if email and password:
+    cookie_login = pytestconfig.getoption("--login_mode") == "cookie"
+    if cookie_login and not request.node.get_closest_marker("form_login"):
+        page.login_with_token(
+            TokenBroker.get_browser_token(email=email, password=password)
+        )
+    else:
         page.login(email=email, password=password)
 
 
 @pytest.fixture(scope="function")
 def create_contact_info(
-    browser: webdriver.Firefox | webdriver.Chrome, setup_user
+    browser: webdriver.Firefox | webdriver.Chrome, setup_user, pytestconfig
 ):
     """
-    Creates contact information using the Faker library.
+    Creates contact information with the shared payload factory.
+
+    The "Add Contact" page is opened only with `--contact_setup=ui`.
     """
 
     logger.info("Create contact.")
-    link = base_url + "addContact"
-    page = AddNewContactPage(browser=browser, url=link)
-    page.open()
+    if pytestconfig.getoption("--contact_setup") == "ui":
+        link = base_url + "addContact"
+        page = AddNewContactPage(browser=browser, url=link)
+        page.open()
 
-    fake = Faker()
-    fake_contact_first_name = fake.first_name()
-    fake_contact_last_name = fake.last_name()
-    fake_contact_date_of_birth = (
-        fake.date_of_birth(minimum_age=6, maximum_age=110)
-    ).strftime("%Y-%m-%d")
-    fake_contact_email = fake.email()
-    fake_contact_phone = fake.basic_phone_number()
-    fake_contact_street_address_1 = fake.street_name()
-    fake_contact_city = fake.city()
-    fake_contact_state = fake.state()
-    fake_contact_postal_code = fake.postalcode()
-    fake_contact_country = fake.country()[:40]
-
-    return (
-        fake_contact_first_name,
-        fake_contact_last_name,
-        fake_contact_date_of_birth,
-        fake_contact_email,
-        fake_contact_phone,
-        fake_contact_street_address_1,
-        fake_contact_city,
-        fake_contact_state,
-        fake_contact_postal_code,
-        fake_contact_country,
-    )
+    payload = PayloadFactory.contact()
+    return tuple(payload[field] for field in CONTACT_INFO_FIELDS)
 
 
 @pytest.fixture(scope="function")
 def created_contact(
+    request,
     browser: webdriver.Firefox | webdriver.Chrome,
     setup_user,
     create_contact_info,
     pytestconfig,
 ):
     """
-    Creates a new contact using Selenium.
+    Creates a new contact and opens its details page.
+
+    The contact is created with Selenium, or through the API
+    with `--contact_setup=api`.
     """
 
     logger.info(
@@ -285,6 +796,23 @@ def created_contact(
         create_contact_info[1],
     )
 
+    if pytestconfig.getoption("--contact_setup") == "api":
+        payload = dict(zip(CONTACT_INFO_FIELDS, create_contact_info))
+        contact_rs_api, _ = ContactsHelper().create_contact(
+            auth_headers=request.getfixturevalue("auth_headers"),
+            payload=payload,
+        )
+        assert (
+            contact_rs_api is not None
+        ), "Response is None, but expected JSON response."
+
+        contact_details_page = ContactDetailsPage(
+            browser=browser, url=base_url + "contactDetails"
+        )
+        contact_details_page.open_contact(contact_rs_api["_id"])
+
+        return contact_details_page, create_contact_info
+
     add_new_contact_link = base_url + "addContact"
     page = AddNewContactPage(browser=browser, url=add_new_contact_link)
     page.open()
@@ -44,6 +44,7 @@ class TestAddNewContactPage:
         page.open()
         page.should_be_add_new_contact_page()
 
+    @pytest.mark.form_login
     def test_logout_from_add_new_contact_page(
         self, browser: webdriver.Firefox | webdriver.Chrome, setup_user
     ):
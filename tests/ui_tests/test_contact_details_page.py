@@ -47,6 +47,7 @@ class TestContactDetailsPage:
 
         page.should_be_contact_details_page()
 
+    @pytest.mark.form_login
     def test_logout_from_contact_details_page(
         self,
         browser: webdriver.Firefox | webdriver.Chrome,
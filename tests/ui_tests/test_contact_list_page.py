@@ -44,6 +44,7 @@ class TestContactListPage:
         page.open()
         page.should_be_contact_list_page()
 
+    @pytest.mark.form_login
     def test_logout(
         self, browser: webdriver.Firefox | webdriver.Chrome, setup_user
     ):
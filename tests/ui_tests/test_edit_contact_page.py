@@ -8,13 +8,13 @@ for the "Edit Contact" page using Selenium WebDriver.
 import logging as logger
 
 import pytest
-from faker import Faker
 from selenium import webdriver
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.wait import WebDriverWait
 
 from src.pages.contact_details_page import ContactDetailsPage
 from src.pages.edit_contact_page import EditContactPage
+from src.payload_factory import PayloadFactory
 from src.requests_utilities import RequestUtilities
 
 pytestmark = pytest.mark.ui
@@ -50,6 +50,7 @@ class TestEditContactPage:
 
         page.should_be_edit_contact_page()
 
+    @pytest.mark.form_login
     def test_logout_from_edit_contact_page(
         self,
         browser: webdriver.Firefox | webdriver.Chrome,
@@ -119,8 +120,7 @@ class TestEditContactPage:
 
         page = EditContactPage(browser=browser, url=browser.current_url)
 
-        fake = Faker()
-        fake_new_phone = fake.basic_phone_number()
+        fake_new_phone = PayloadFactory.contact()["phone"]
 
         page.edit_contact(what="phone", data=fake_new_phone)
 
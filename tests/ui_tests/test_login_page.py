@@ -5,10 +5,8 @@ This module contains UI tests for the "Login" page using Selenium WebDriver.
 # pylint: disable=unused-argument
 
 import logging as logger
-import os
 
 import pytest
-from dotenv import load_dotenv
 from selenium import webdriver
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.wait import WebDriverWait
@@ -21,10 +19,9 @@ pytestmark = pytest.mark.ui
 
 base_url = RequestUtilities.get_base_url()
 
-load_dotenv()
-
 
 @pytest.mark.login
+@pytest.mark.form_login
 class TestLoginPage:
     """
     Test suite for the "Login" page.
@@ -46,7 +43,10 @@ class TestLoginPage:
         page.should_be_login_page()
 
     def test_login(
-        self, browser: webdriver.Firefox | webdriver.Chrome, setup_user
+        self,
+        browser: webdriver.Firefox | webdriver.Chrome,
+        setup_user,
+        user_account,
     ):
         """
         Verifies that the user can log in successfully.
@@ -57,8 +57,8 @@ class TestLoginPage:
         page = LoginPage(browser=browser, url=link)
         page.open()
 
-        email = os.getenv("MY_EMAIL")
-        password = os.getenv("MY_PASSWORD")
+        email = user_account["email"]
+        password = user_account["password"]
 
         if email and password:
             page.login(email=email, password=password)
@@ -5,13 +5,13 @@ This module contains UI tests for the "Register" page using Selenium WebDriver.
 import logging as logger
 
 import pytest
-from faker import Faker
 from selenium import webdriver
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.wait import WebDriverWait
 
 from src.pages.login_page import LoginPage
 from src.pages.register_page import RegisterPage
+from src.payload_factory import PayloadFactory
 from src.requests_utilities import RequestUtilities
 
 pytestmark = pytest.mark.ui
@@ -52,11 +52,11 @@ class TestRegisterPage:
         page = RegisterPage(browser=browser, url=link)
         page.open()
 
-        fake = Faker()
-        user_first_name = fake.first_name()
-        user_last_name = fake.last_name()
-        user_email = fake.email()
-        user_password = fake.password(length=8, special_chars=False)
+        payload = PayloadFactory.user()
+        user_first_name = payload["firstName"]
+        user_last_name = payload["lastName"]
+        user_email = payload["email"]
+        user_password = payload["password"]
         logger.info(
             "Create fake user with\n"
             "first name: %s, "
@@ -97,11 +97,11 @@ class TestRegisterPage:
         page = RegisterPage(browser=browser, url=link)
         page.open()
 
-        fake = Faker()
-        user_first_name = fake.first_name()
-        user_last_name = fake.last_name()
-        user_email = fake.email()
-        user_password = fake.password(length=4, special_chars=False)
+        payload = PayloadFactory.user()
+        user_first_name = payload["firstName"]
+        user_last_name = payload["lastName"]
+        user_email = payload["email"]
+        user_password = payload["password"][:4]
         logger.info(
             "Create fake user with\n"
             "first name: %s, "